@@ -0,0 +1,257 @@
+"""
+Catalog of every domain and challenge under domains/, kept in SQLite.
+
+The index in .catalog.db records each challenge's domain, kyu, name, title,
+files and solve status. Updating it only stats directories: a challenge is
+re-read when its directory (or README) mtime differs from the one stored,
+and entries whose directories are gone are dropped. A challenge counts as
+solved once its model solutions have been revealed, which only happens
+after every test passes.
+
+Usage:
+    python catalog.py list                           # every challenge
+    python catalog.py list --domain shell_scripting --kyu 8 --unsolved
+    python catalog.py search parser
+    python catalog.py generate                       # rewrite domains.md
+"""
+
+from typing import Any, Iterator
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DOMAINS_DIR = os.path.join(ROOT, "domains")
+INDEX_PATH = os.path.join(ROOT, ".catalog.db")
+DOMAINS_MD = os.path.join(ROOT, "domains.md")
+
+# domains announced in domains.md before any challenges exist for them
+PLANNED_DOMAINS = [
+    "Web Development",
+    "DevOps and Infrastructure",
+    "Data Engineering",
+    "Machine Learning and AI",
+    "System Design",
+    "Security",
+]
+
+# written by the review step, which only runs after all tests pass
+SOLVED_MARKERS = ("model_solutions.py", "solution_analysis.md")
+
+_KYU_DIR = re.compile(r"(\d)_kyu\Z")
+_KYU_SUFFIX = re.compile(r"\s*\(\d kyu\)\s*\Z")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS domains (
+    name     TEXT PRIMARY KEY,
+    title    TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS challenges (
+    path     TEXT PRIMARY KEY,
+    domain   TEXT NOT NULL,
+    kyu      INTEGER NOT NULL,
+    name     TEXT NOT NULL,
+    title    TEXT NOT NULL,
+    files    TEXT NOT NULL,
+    solved   INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS challenges_domain_kyu ON challenges (domain, kyu);
+"""
+
+
+def _read_title(readme_path: str, default: str) -> str:
+    try:
+        with open(readme_path) as f:
+            for line in f:
+                if line.startswith("# "):
+                    return line[2:].strip()
+    except FileNotFoundError:
+        pass
+    return default
+
+
+def _mtime_ns(directory: str) -> int:
+    # editing a README in place doesn't touch its directory's mtime
+    mtime = os.stat(directory).st_mtime_ns
+    try:
+        return max(mtime, os.stat(os.path.join(directory, "README.md")).st_mtime_ns)
+    except FileNotFoundError:
+        return mtime
+
+
+def _iter_challenge_dirs(domain_dir: str) -> Iterator[tuple[int, str]]:
+    for kyu_entry in os.scandir(domain_dir):
+        match = _KYU_DIR.match(kyu_entry.name)
+        if not match or not kyu_entry.is_dir():
+            continue
+        for entry in os.scandir(kyu_entry.path):
+            if entry.is_dir() and not entry.name.startswith((".", "__")):
+                yield int(match.group(1)), entry.path
+
+
+class Catalog:
+    """SQLite-backed index of the domains tree."""
+
+    def __init__(self, index_path: str = INDEX_PATH, domains_dir: str = DOMAINS_DIR):
+        self.domains_dir = domains_dir
+        self._db = sqlite3.connect(index_path)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(_SCHEMA)
+
+    def update(self) -> int:
+        """Bring the index in line with the tree, returning how many rows changed."""
+        changed = 0
+        stored_domains = dict(self._db.execute("SELECT name, mtime_ns FROM domains"))
+        stored_challenges = dict(self._db.execute("SELECT path, mtime_ns FROM challenges"))
+        seen_domains = set()
+        seen_challenges = set()
+        with self._db:
+            for domain_entry in os.scandir(self.domains_dir):
+                if not domain_entry.is_dir() or domain_entry.name.startswith((".", "__")):
+                    continue
+                domain = domain_entry.name
+                seen_domains.add(domain)
+                mtime = _mtime_ns(domain_entry.path)
+                if stored_domains.get(domain) != mtime:
+                    title = _read_title(os.path.join(domain_entry.path, "README.md"), domain)
+                    self._db.execute("INSERT OR REPLACE INTO domains VALUES (?, ?, ?)",
+                                     (domain, title, mtime))
+                    changed += 1
+                for kyu, challenge_dir in _iter_challenge_dirs(domain_entry.path):
+                    path = os.path.relpath(challenge_dir, self.domains_dir)
+                    seen_challenges.add(path)
+                    mtime = _mtime_ns(challenge_dir)
+                    if stored_challenges.get(path) == mtime:
+                        continue
+                    self._index_challenge(path, domain, kyu, challenge_dir, mtime)
+                    changed += 1
+            for domain in stored_domains.keys() - seen_domains:
+                self._db.execute("DELETE FROM domains WHERE name = ?", (domain,))
+                changed += 1
+            for path in stored_challenges.keys() - seen_challenges:
+                self._db.execute("DELETE FROM challenges WHERE path = ?", (path,))
+                changed += 1
+        return changed
+
+    def _index_challenge(self, path: str, domain: str, kyu: int, challenge_dir: str,
+                         mtime: int) -> None:
+        name = os.path.basename(challenge_dir)
+        files = sorted(entry.name for entry in os.scandir(challenge_dir)
+                       if entry.is_file() and not entry.name.startswith("."))
+        title = _KYU_SUFFIX.sub("", _read_title(os.path.join(challenge_dir, "README.md"), name))
+        solved = any(marker in files for marker in SOLVED_MARKERS)
+        self._db.execute("INSERT OR REPLACE INTO challenges VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                         (path, domain, kyu, name, title, json.dumps(files), solved, mtime))
+
+    def domains(self) -> list[dict[str, Any]]:
+        return [dict(row) for row in self._db.execute(
+            "SELECT name, title FROM domains ORDER BY name")]
+
+    def challenges(self, domain: str | None = None, kyu: int | None = None,
+                   solved: bool | None = None, search: str | None = None) -> list[dict[str, Any]]:
+        """Challenges matching every filter given, easiest kyu first."""
+        clauses = []
+        params: list[Any] = []
+        if domain is not None:
+            clauses.append("domain = ?")
+            params.append(domain)
+        if kyu is not None:
+            clauses.append("kyu = ?")
+            params.append(kyu)
+        if solved is not None:
+            clauses.append("solved = ?")
+            params.append(solved)
+        if search:
+            clauses.append("(name LIKE ? OR title LIKE ? OR domain LIKE ?)")
+            params += [f"%{search}%"] * 3
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._db.execute(f"SELECT path, domain, kyu, name, title, files, solved FROM challenges "
+                                f"{where} ORDER BY domain, kyu DESC, name", params)
+        return [{**row, "files": json.loads(row["files"]), "solved": bool(row["solved"])}
+                for row in map(dict, rows)]
+
+    def render_domains_md(self) -> str:
+        domains = self.domains()
+        lines = [
+            "# AnyWars Domains",
+            "",
+            "This document lists the specialized domains available for AnyWars challenges. "
+            "Each domain has its own directory with a detailed README and organized challenges by kyu level.",
+            "",
+            "## Available Domains",
+            "",
+        ]
+        lines += [f"- [{domain['title']}](/domains/{domain['name']})" for domain in domains]
+        titles = {domain["title"] for domain in domains}
+        lines += [f"- {title}" for title in PLANNED_DOMAINS if title not in titles]
+        lines += ["", "## Challenges", ""]
+        for domain in domains:
+            challenges = self.challenges(domain=domain["name"])
+            if not challenges:
+                continue
+            lines += [f"### {domain['title']}", ""]
+            lines += [f"- {challenge['kyu']} kyu: [{challenge['title']}](/domains/{challenge['path']})"
+                      + (" (solved)" if challenge["solved"] else "") for challenge in challenges]
+            lines.append("")
+        lines.append("To start working with a domain, navigate to its directory to see the "
+                     "detailed description and available challenges.")
+        return "\n".join(lines)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "Catalog":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _print_challenges(challenges: list[dict[str, Any]]) -> None:
+    for challenge in challenges:
+        status = "solved" if challenge["solved"] else ""
+        print(f"{challenge['domain']:<20} {challenge['kyu']} kyu  {challenge['name']:<24} "
+              f"{challenge['title']:<32} {status}".rstrip())
+    print(f"\n{len(challenges)} challenges")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--index", default=INDEX_PATH, help="index file (default: .catalog.db)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("update", help="refresh the index and report how many entries changed")
+    list_parser = commands.add_parser("list", help="list challenges")
+    list_parser.add_argument("--domain")
+    list_parser.add_argument("--kyu", type=int, choices=range(1, 9))
+    status = list_parser.add_mutually_exclusive_group()
+    status.add_argument("--solved", dest="solved", action="store_true", default=None)
+    status.add_argument("--unsolved", dest="solved", action="store_false")
+    search_parser = commands.add_parser("search", help="find challenges by name, title or domain")
+    search_parser.add_argument("term")
+    generate_parser = commands.add_parser("generate", help="write domains.md from the index")
+    generate_parser.add_argument("--output", default=DOMAINS_MD)
+    args = parser.parse_args(argv)
+
+    with Catalog(args.index) as catalog:
+        changed = catalog.update()
+        match args.command:
+            case "update":
+                print(f"{changed} entries updated")
+            case "list":
+                _print_challenges(catalog.challenges(args.domain, args.kyu, args.solved))
+            case "search":
+                _print_challenges(catalog.challenges(search=args.term))
+            case "generate":
+                with open(args.output, "w") as f:
+                    f.write(catalog.render_domains_md())
+                print(f"wrote {os.path.relpath(args.output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+Scaling benchmark for batch parsing.
+
+Generates a directory of per-tenant config files and times parse_configs
+with 1..N workers, printing the throughput and speedup for each pool size.
+
+Usage: python bench_batch.py [file_count] [lines_per_file] [executor]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from config_batch import parse_configs
+
+SAMPLE_VALUES = ["42", "-7", "3.14", "true", "False", "dark", '"quoted"', "'single'", "host.example.com"]
+
+
+def write_tenant_configs(directory: str, file_count: int, lines_per_file: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    paths = []
+    for index in range(file_count):
+        path = os.path.join(directory, f"tenant_{index}.conf")
+        with open(path, "w") as f:
+            for line_no in range(lines_per_file):
+                if line_no % 10 == 0:
+                    f.write("# section\n")
+                else:
+                    f.write(f"key_{line_no} = {rng.choice(SAMPLE_VALUES)}\n")
+        paths.append(path)
+    return paths
+
+
+def main() -> int:
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    lines_per_file = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    executor = sys.argv[3] if len(sys.argv) > 3 else "process"
+    max_workers = os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_tenant_configs(directory, file_count, lines_per_file)
+        print(f"{file_count:,} files x {lines_per_file:,} lines, {executor} pool")
+        baseline = None
+        workers = 1
+        while workers <= max_workers:
+            start = time.perf_counter()
+            results = parse_configs(paths, workers=workers, executor=executor)
+            elapsed = time.perf_counter() - start
+            assert all(isinstance(result, dict) for result in results.values())
+            baseline = baseline or elapsed
+            print(f"workers={workers:<3} {elapsed:7.3f}s {file_count / elapsed:10,.0f} files/s "
+                  f"speedup {baseline / elapsed:5.2f}x")
+            workers = workers * 2 if workers * 2 <= max_workers or workers == max_workers else max_workers
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
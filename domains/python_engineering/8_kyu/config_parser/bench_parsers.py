@@ -0,0 +1,182 @@
+"""
+Benchmark suite for every config parser in this challenge.
+
+Generates synthetic config files across sizes and content mixes, then times
+config_parser.parse_config (each engine, plus the lazy view) and every model
+solution on them, recording lines/sec and peak tracemalloc memory.
+
+Usage:
+    python bench_parsers.py                                # default sizes
+    python bench_parsers.py --sizes 10 1000 100000 10000000
+    python bench_parsers.py --output results.json --baseline baseline.json
+    python bench_parsers.py --output baseline.json         # record a baseline
+
+Exits with status 1 when an implementation is slower, or uses more memory,
+than the baseline by more than --threshold.
+"""
+
+from typing import Any, Callable
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from config_lazy import parse_config_lazy
+from config_parser import parse_config
+import model_solutions
+
+Parser = Callable[[str], Any]
+
+IMPLEMENTATIONS: dict[str, Parser] = {
+    "parse_config": parse_config,
+    "parse_config[mmap]": lambda path: parse_config(path, engine="mmap"),
+    # materializes every value, the worst case for the lazy view
+    "parse_config_lazy[dict]": lambda path: dict(parse_config_lazy(path)),
+    "model.simple": model_solutions.parse_config_simple,
+    "model.regex": model_solutions.parse_config_regex,
+    "model.functional": model_solutions.parse_config_functional,
+    "model.class_based": model_solutions.parse_config_class_based,
+    "model.pythonic": model_solutions.parse_config_pythonic,
+}
+
+# relative weights of each kind of line
+MIXES: dict[str, dict[str, int]] = {
+    "clean": {"string": 4, "int": 2, "float": 2, "bool": 2},
+    "commented": {"comment": 4, "blank": 2, "string": 2, "int": 1, "bool": 1},
+    "quoted": {"double_quote": 4, "single_quote": 3, "string": 3},
+    "numeric": {"int": 5, "float": 5},
+    "dirty": {"invalid": 3, "string": 3, "int": 2, "comment": 1, "broken_quote": 1},
+}
+
+LINE_MAKERS: dict[str, Callable[[random.Random, int], str]] = {
+    "comment": lambda rng, i: "# generated comment line\n",
+    "blank": lambda rng, i: "\n",
+    "string": lambda rng, i: f"key_{i} = value {rng.randrange(1000)}\n",
+    "int": lambda rng, i: f"key_{i} = {rng.randrange(-10**6, 10**6)}\n",
+    "float": lambda rng, i: f"key_{i} = {rng.uniform(-1000, 1000):.4f}\n",
+    "bool": lambda rng, i: f"key_{i} = {rng.choice(['true', 'False', 'TRUE'])}\n",
+    "double_quote": lambda rng, i: f'key_{i} = "quoted {rng.randrange(1000)}"\n',
+    "single_quote": lambda rng, i: f"key_{i} = '{rng.randrange(1000)}'\n",
+    "broken_quote": lambda rng, i: f'key_{i} = "unterminated\n',
+    "invalid": lambda rng, i: "this line has no separator\n",
+}
+
+
+def write_config(path: str, lines: int, mix: str, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    kinds = list(MIXES[mix])
+    weights = list(MIXES[mix].values())
+    with open(path, "w") as f:
+        # write in batches so 10M-line files don't sit in memory
+        batch = []
+        for index, kind in enumerate(rng.choices(kinds, weights, k=lines)):
+            batch.append(LINE_MAKERS[kind](rng, index))
+            if len(batch) == 10_000:
+                f.writelines(batch)
+                batch.clear()
+        f.writelines(batch)
+
+
+def measure(parser: Parser, path: str, repeats: int) -> tuple[float, int]:
+    # warm up the page cache and any lazily compiled patterns
+    parser(path)
+    seconds = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        parser(path)
+        seconds = min(seconds, time.perf_counter() - start)
+    # memory is traced in a separate run, tracemalloc distorts timings
+    tracemalloc.start()
+    try:
+        parser(path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def run(sizes: list[int], mixes: list[str], implementations: list[str],
+        repeats: int) -> list[dict[str, Any]]:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for lines in sizes:
+            # big inputs are timed once, small ones need repeats to be stable
+            size_repeats = repeats if lines <= 100_000 else 1
+            for mix in mixes:
+                path = os.path.join(directory, f"{mix}_{lines}.conf")
+                write_config(path, lines, mix)
+                for name in implementations:
+                    seconds, peak = measure(IMPLEMENTATIONS[name], path, size_repeats)
+                    result = {
+                        "implementation": name,
+                        "lines": lines,
+                        "mix": mix,
+                        "seconds": seconds,
+                        "lines_per_sec": lines / seconds if seconds else float("inf"),
+                        "peak_bytes": peak,
+                    }
+                    results.append(result)
+                    print(f"{name:<20} {mix:<10} {lines:>10,} lines "
+                          f"{result['lines_per_sec']:>14,.0f} lines/s {peak / 1024:>12,.0f} KiB")
+                os.unlink(path)
+    return results
+
+
+def find_regressions(results: list[dict[str, Any]], baseline: list[dict[str, Any]],
+                     threshold: float) -> list[str]:
+    expected = {(entry["implementation"], entry["lines"], entry["mix"]): entry for entry in baseline}
+    regressions = []
+    for result in results:
+        previous = expected.get((result["implementation"], result["lines"], result["mix"]))
+        if previous is None:
+            continue
+        label = f"{result['implementation']} {result['mix']} {result['lines']:,} lines"
+        if result["lines_per_sec"] < previous["lines_per_sec"] * (1 - threshold):
+            regressions.append(f"{label}: {result['lines_per_sec']:,.0f} lines/s, "
+                               f"baseline {previous['lines_per_sec']:,.0f}")
+        if result["peak_bytes"] > previous["peak_bytes"] * (1 + threshold):
+            regressions.append(f"{label}: peak {result['peak_bytes']:,} bytes, "
+                               f"baseline {previous['peak_bytes']:,}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 100_000])
+    parser.add_argument("--mixes", nargs="+", choices=list(MIXES), default=list(MIXES))
+    parser.add_argument("--implementations", nargs="+", choices=list(IMPLEMENTATIONS),
+                        default=list(IMPLEMENTATIONS))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed fractional slowdown or memory growth (default 0.25)")
+    args = parser.parse_args(argv)
+
+    # the dirty mix would otherwise log a warning per bad line
+    logging.disable(logging.WARNING)
+    results = run(args.sizes, args.mixes, args.implementations, args.repeats)
+    logging.disable(logging.NOTSET)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"python": platform.python_version(), "results": results}, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Micro-benchmark for value classification.
+
+Compares the precompiled single-pass classifier in config_parser against the
+original chained-check implementation on a corpus of mixed value tokens.
+
+Usage: python bench_value_types.py [corpus_size]
+"""
+
+import random
+import re
+import sys
+import time
+
+from config_parser import ValueType, get_value_type
+
+
+def legacy_get_value_type(value_token: str) -> ValueType:
+    """The original classifier: quote count, lower() and two re.match calls."""
+    if not len(value_token):
+        return ValueType.STRING
+    quote_types = [("\"", ValueType.DOUBLE_QUOTE), ("'", ValueType.SINGLE_QUOTE)]
+    for quote_token, quote_value_type in quote_types:
+        if value_token[0] == quote_token:
+            if value_token.count(quote_token) != 2 or value_token[-1] != quote_token:
+                return ValueType.STRING
+            return quote_value_type
+    value_lower = value_token.lower()
+    if value_lower == "true" or value_lower == "false":
+        return ValueType.BOOL
+    if re.match(r"^-?\d+$", value_token):
+        return ValueType.INT
+    if value_token != "." and re.match(r"^-?\d*\.\d*$", value_token):
+        return ValueType.FLOAT
+    return ValueType.STRING
+
+
+SAMPLE_VALUES = [
+    "", "hello", "My Application", "dark", "localhost:8080", "42a", "3.14.15",
+    "42", "-7", "0", "1234567890", "3.14", "-0.5", ".5", "12.", ".",
+    "true", "False", "TRUE", "truthy", '"quoted"', '""', '"42"', '"unterminated',
+    "'single'", "'it's'", '"value with \'nested\' quotes"',
+]
+
+
+def build_corpus(size: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [rng.choice(SAMPLE_VALUES) for _ in range(size)]
+
+
+def time_classifier(classify, corpus: list[str], repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for value in corpus:
+            classify(value)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    corpus = build_corpus(size)
+
+    # both classifiers must agree before timing means anything
+    for value in SAMPLE_VALUES:
+        assert get_value_type(value) == legacy_get_value_type(value), value
+
+    legacy = time_classifier(legacy_get_value_type, corpus)
+    current = time_classifier(get_value_type, corpus)
+    print(f"corpus:   {size:,} values")
+    print(f"legacy:   {legacy:.3f}s ({size / legacy:,.0f} values/s)")
+    print(f"compiled: {current:.3f}s ({size / current:,.0f} values/s)")
+    print(f"speedup:  {legacy / current:.2f}x")
+    return 0 if current < legacy else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
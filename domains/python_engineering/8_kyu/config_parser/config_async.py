@@ -0,0 +1,76 @@
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Any, AsyncIterator, Iterable, Iterator
+import asyncio
+
+from config_batch import ParseResult
+from config_parser import Engine, iter_config, parse_config
+
+
+async def parse_config_async(file_path: str, engine: str = Engine.TEXT,
+                             executor: Executor | None = None) -> dict[str, Any]:
+    """Parse a configuration file without blocking the event loop.
+
+    Reading and parsing run on executor (the loop's default thread pool
+    when None), so the result is identical to parse_config.
+
+    Raises:
+        FileNotFoundError: If the specified file doesn't exist
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, parse_config, file_path, engine)
+
+
+async def parse_configs_async(paths: Iterable[str], limit: int = 8,
+                              engine: str = Engine.TEXT,
+                              executor: Executor | None = None) -> dict[str, ParseResult]:
+    """Parse many configuration files with at most limit in flight at once.
+
+    Like parse_configs, a failing file yields its exception instead of
+    aborting the batch.
+
+    Returns:
+        Dictionary mapping each path, in input order, to its parsed config
+        or exception
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def parse_one(path: str) -> ParseResult:
+        async with semaphore:
+            try:
+                return await parse_config_async(path, engine, executor)
+            except Exception as error:
+                return error
+
+    paths = list(paths)
+    results = await asyncio.gather(*(parse_one(path) for path in paths))
+    return dict(zip(paths, results))
+
+
+def _next_batch(entries: Iterator[tuple[str, Any, int]], batch_size: int) -> list[tuple[str, Any, int]]:
+    return list(islice(entries, batch_size))
+
+
+async def aiter_config(file_path: str, engine: str = Engine.TEXT, batch_size: int = 1024,
+                       executor: Executor | None = None) -> AsyncIterator[tuple[str, Any, int]]:
+    """Async version of iter_config.
+
+    Entries are pulled off the loop in batches of batch_size, so the loop
+    only wakes once per batch and never holds more than one batch in memory.
+
+    Yields:
+        (key, value, line_no) tuples in file order
+    """
+    loop = asyncio.get_running_loop()
+    entries = iter_config(file_path, engine)
+    try:
+        while batch := await loop.run_in_executor(executor, _next_batch, entries, batch_size):
+            for entry in batch:
+                yield entry
+    finally:
+        try:
+            entries.close()
+        except ValueError:
+            # cancelled mid-batch, the worker still owns the generator and
+            # the file is closed once it is garbage collected
+            pass
@@ -0,0 +1,82 @@
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Mapping
+import os
+import threading
+
+from config_parser import Engine, parse_config
+
+# files are unchanged while all of these match the cached stat
+FileStamp = tuple[int, int, int]
+
+def get_file_stamp(stat: os.stat_result) -> FileStamp:
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class CachedConfigLoader:
+    """Serve parsed configs from a bounded LRU cache keyed on file identity.
+    
+    Entries are keyed on the file's real path and validated against its
+    (st_mtime_ns, st_size, st_ino) stamp, so an unchanged file costs a
+    single stat call instead of a read and parse.
+    """
+    
+    def __init__(self, max_entries: int = 128, engine: str = Engine.TEXT):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.engine = engine
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[FileStamp, Mapping[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def load(self, file_path: str) -> Mapping[str, Any]:
+        """Return a read-only view of the parsed configuration.
+        
+        Args:
+            file_path: Path to the configuration file
+            
+        Returns:
+            Read-only mapping shared by every caller until the file changes
+            
+        Raises:
+            FileNotFoundError: If the specified file doesn't exist
+        """
+        real_path = os.path.realpath(file_path)
+        stamp = get_file_stamp(os.stat(real_path))
+        with self._lock:
+            entry = self._entries.get(real_path)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(real_path)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        
+        # parse outside the lock so slow files don't stall other lookups
+        config = MappingProxyType(parse_config(real_path, self.engine))
+        with self._lock:
+            self._entries[real_path] = (stamp, config)
+            self._entries.move_to_end(real_path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return config
+    
+    def invalidate(self, file_path: str) -> None:
+        with self._lock:
+            self._entries.pop(os.path.realpath(file_path), None)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
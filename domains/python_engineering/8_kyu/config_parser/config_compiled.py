@@ -0,0 +1,250 @@
+"""
+Compiled binary snapshots of config files.
+
+Layout (little-endian), all offsets relative to the start of the file:
+
+    header   magic, format version, entry count, hash table capacity,
+             source st_mtime_ns, st_size and sha256 digest
+    table    capacity x u32 open-addressing slots, entry index + 1 (0 = empty)
+    entries  count x (key offset, key length, value offset, value length, tag)
+    data     key bytes and encoded values
+
+Entries are stored in parse_config order, so iteration order matches.
+"""
+
+from collections.abc import Mapping
+from enum import IntEnum
+from typing import Any, Iterator
+import hashlib
+import mmap
+import os
+import struct
+import zlib
+
+from config_parser import Engine, parse_config
+
+MAGIC = b"CFGSNAP\0"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sHHIIqQ32s")
+_SLOT = struct.Struct("<I")
+_ENTRY = struct.Struct("<IIIIB3x")
+_INT64 = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+
+
+class _Tag(IntEnum):
+    STR = 0
+    INT = 1
+    BIG_INT = 2
+    FLOAT = 3
+    BOOL = 4
+
+
+def _encode_value(value: Any) -> tuple[_Tag, bytes]:
+    # bool is an int subclass, so it has to be checked first
+    if isinstance(value, bool):
+        return _Tag.BOOL, b"\1" if value else b"\0"
+    if isinstance(value, int):
+        if -(1 << 63) <= value < (1 << 63):
+            return _Tag.INT, _INT64.pack(value)
+        return _Tag.BIG_INT, str(value).encode("ascii")
+    if isinstance(value, float):
+        return _Tag.FLOAT, _FLOAT.pack(value)
+    return _Tag.STR, value.encode("utf-8")
+
+
+def _decode_value(tag: int, data: memoryview) -> Any:
+    match tag:
+        case _Tag.INT:
+            return _INT64.unpack(data)[0]
+        case _Tag.BIG_INT:
+            return int(bytes(data))
+        case _Tag.FLOAT:
+            return _FLOAT.unpack(data)[0]
+        case _Tag.BOOL:
+            return data[0] == 1
+        case _:
+            return str(data, "utf-8")
+
+
+def _slot_of(key_bytes: bytes, mask: int) -> int:
+    return zlib.crc32(key_bytes) & mask
+
+
+def build_snapshot(src: str, engine: str = Engine.TEXT) -> bytes:
+    """Parse src and return its binary snapshot.
+
+    Raises:
+        FileNotFoundError: If src doesn't exist
+    """
+    stat = os.stat(src)
+    digest = hashlib.sha256()
+    with open(src, "rb") as file:
+        while chunk := file.read(1 << 20):
+            digest.update(chunk)
+    config = parse_config(src, engine)
+
+    capacity = 8
+    while capacity < len(config) * 2:
+        capacity *= 2
+    mask = capacity - 1
+    data_start = _HEADER.size + capacity * _SLOT.size + len(config) * _ENTRY.size
+
+    slots = [0] * capacity
+    entries = bytearray()
+    data = bytearray()
+    for index, (key, value) in enumerate(config.items()):
+        key_bytes = key.encode("utf-8")
+        tag, value_bytes = _encode_value(value)
+        slot = _slot_of(key_bytes, mask)
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = index + 1
+        key_offset = data_start + len(data)
+        data += key_bytes
+        value_offset = data_start + len(data)
+        data += value_bytes
+        entries += _ENTRY.pack(key_offset, len(key_bytes), value_offset, len(value_bytes), tag)
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(config), capacity,
+                          stat.st_mtime_ns, stat.st_size, digest.digest())
+    return b"".join((header, struct.pack(f"<{capacity}I", *slots), entries, data))
+
+
+def compile_config(src: str, dst: str, engine: str = Engine.TEXT) -> None:
+    """Parse src and write a binary snapshot of it to dst.
+
+    The snapshot is written to a temporary file and renamed into place, so
+    readers never map a half-written file.
+
+    Raises:
+        FileNotFoundError: If src doesn't exist
+    """
+    snapshot = build_snapshot(src, engine)
+    temp_path = f"{dst}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(snapshot)
+    os.replace(temp_path, dst)
+
+
+class CompiledConfig(Mapping):
+    """Read-only mapping over a memory-mapped snapshot.
+
+    Opening only reads the header; each lookup probes the hash table in the
+    mapped file and decodes just the one value it returns.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._open(mapped, mapped, path)
+
+    @classmethod
+    def from_buffer(cls, buffer: memoryview | mmap.mmap, owner: Any, source: str) -> "CompiledConfig":
+        """Wrap a snapshot that is already in memory, such as shared memory.
+
+        owner.close() is called by close(), after the view is released.
+
+        Raises:
+            ValueError: If buffer doesn't hold a supported snapshot
+        """
+        compiled = cls.__new__(cls)
+        compiled._open(buffer, owner, source)
+        return compiled
+
+    def _open(self, buffer: memoryview | mmap.mmap, owner: Any, source: str) -> None:
+        self._mmap = buffer
+        self._owner = owner
+        self._view = memoryview(buffer)
+        try:
+            (magic, version, _, self._count, self._capacity,
+             self.source_mtime_ns, self.source_size, self.source_digest) = _HEADER.unpack_from(self._mmap)
+        except struct.error:
+            self.close()
+            raise ValueError(f"not a compiled config snapshot: {source}")
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"unsupported compiled config snapshot: {source}")
+        self._mask = self._capacity - 1
+        self._entries_start = _HEADER.size + self._capacity * _SLOT.size
+
+    def _entry(self, index: int) -> tuple[int, int, int, int, int]:
+        return _ENTRY.unpack_from(self._mmap, self._entries_start + index * _ENTRY.size)
+
+    def _find(self, key: str) -> tuple[int, int, int, int, int] | None:
+        key_bytes = key.encode("utf-8")
+        slot = _slot_of(key_bytes, self._mask)
+        while True:
+            index = _SLOT.unpack_from(self._mmap, _HEADER.size + slot * _SLOT.size)[0]
+            if index == 0:
+                return None
+            entry = self._entry(index - 1)
+            key_offset, key_len = entry[0], entry[1]
+            # compare in place, without copying the stored key out
+            if self._view[key_offset:key_offset + key_len] == key_bytes:
+                return entry
+            slot = (slot + 1) & self._mask
+
+    def __getitem__(self, key: str) -> Any:
+        entry = self._find(key) if isinstance(key, str) else None
+        if entry is None:
+            raise KeyError(key)
+        _, _, value_offset, value_len, tag = entry
+        return _decode_value(tag, self._view[value_offset:value_offset + value_len])
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            key_offset, key_len, _, _, _ = self._entry(index)
+            yield str(self._view[key_offset:key_offset + key_len], "utf-8")
+
+    def is_stale(self, src: str) -> bool:
+        """True if src no longer matches the file this snapshot was built from."""
+        stat = os.stat(src)
+        return (stat.st_mtime_ns, stat.st_size) != (self.source_mtime_ns, self.source_size)
+
+    def close(self) -> None:
+        self._view.release()
+        self._owner.close()
+
+    def __enter__(self) -> "CompiledConfig":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def load_compiled_config(src: str, dst: str | None = None,
+                         engine: str = Engine.TEXT) -> CompiledConfig:
+    """Open the snapshot for src, compiling it first if missing or out of date.
+
+    Args:
+        src: Path to the configuration file
+        dst: Snapshot path, defaults to src with a ".snap" suffix
+        engine: Parsing engine used when the snapshot has to be rebuilt
+
+    Raises:
+        FileNotFoundError: If src doesn't exist
+    """
+    dst = dst or f"{src}.snap"
+    try:
+        compiled = CompiledConfig(dst)
+    except (FileNotFoundError, ValueError):
+        compiled = None
+    if compiled is not None:
+        try:
+            stale = compiled.is_stale(src)
+        except OSError:
+            compiled.close()
+            raise
+        if not stale:
+            return compiled
+        compiled.close()
+    compile_config(src, dst, engine)
+    return CompiledConfig(dst)
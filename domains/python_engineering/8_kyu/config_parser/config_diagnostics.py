@@ -0,0 +1,97 @@
+from array import array
+from enum import IntEnum
+from typing import Callable, NamedTuple
+import logging
+
+
+class Reason(IntEnum):
+    MISSING_SEPARATOR = 1
+    INVALID_VALUE = 2
+
+
+_REASON_TEXT = {
+    Reason.MISSING_SEPARATOR: "missing '='",
+    Reason.INVALID_VALUE: "invalid value",
+}
+
+
+class DiagnosticRecord(NamedTuple):
+    line_no: int
+    # byte offset of the start of the line, -1 if the parser couldn't tell
+    offset: int
+    reason: Reason
+
+
+class Diagnostics:
+    """Collect invalid lines as compact records instead of logging each one.
+
+    Records go into fixed-size arrays allocated up front, so recording one
+    is a couple of integer stores and never formats a string. Only every
+    sample_every-th invalid line is kept and at most capacity are stored;
+    total always counts all of them. The text of the first examples stored
+    lines is kept as well, for finish() to quote in a single summary to
+    sink, which is logging.warning unless another callable (or None) is
+    given.
+    """
+
+    __slots__ = ("capacity", "sample_every", "examples", "sink", "total", "_stored",
+                 "_line_nos", "_offsets", "_reasons", "_texts")
+
+    def __init__(self, capacity: int = 256, sample_every: int = 1,
+                 sink: Callable[[str], None] | None = logging.warning, examples: int = 5):
+        if capacity < 0 or sample_every < 1 or examples < 0:
+            raise ValueError("capacity and examples must be >= 0 and sample_every >= 1")
+        self.capacity = capacity
+        self.sample_every = sample_every
+        self.examples = min(examples, capacity)
+        self.sink = sink
+        self.total = 0
+        self._stored = 0
+        self._line_nos = array("q", bytes(8 * capacity))
+        self._offsets = array("q", bytes(8 * capacity))
+        self._reasons = bytearray(capacity)
+        self._texts: list[str] = []
+
+    def record(self, reason: int, line_no: int, offset: int = -1, text: str | None = None) -> None:
+        skipped = self.total % self.sample_every
+        self.total += 1
+        stored = self._stored
+        if skipped or stored == self.capacity:
+            return
+        self._line_nos[stored] = line_no
+        self._offsets[stored] = offset
+        self._reasons[stored] = reason
+        if stored < self.examples:
+            self._texts.append(text or "")
+        self._stored = stored + 1
+
+    @property
+    def dropped(self) -> int:
+        return self.total - self._stored
+
+    def records(self) -> list[DiagnosticRecord]:
+        return [DiagnosticRecord(self._line_nos[i], self._offsets[i], Reason(self._reasons[i]))
+                for i in range(self._stored)]
+
+    def clear(self) -> None:
+        self.total = 0
+        self._stored = 0
+        self._texts.clear()
+
+    def summary(self, file_path: str) -> str:
+        """Describe the invalid lines, quoting the first few of them."""
+        quoted = [f"line {self._line_nos[i]} ({_REASON_TEXT[Reason(self._reasons[i])]}): {text}"
+                  for i, text in enumerate(self._texts)]
+        more = self.total - len(quoted)
+        if more:
+            quoted.append(f"and {more} more")
+        return f"invalid format in {file_path}, {self.total} lines skipped: " + "; ".join(quoted)
+
+    def finish(self, file_path: str) -> None:
+        """Emit the one summary for this parse, if any.
+
+        Only what record() kept is used, so the source is never read again
+        and file_path just names it.
+        """
+        if self.total and self.sink is not None:
+            self.sink(self.summary(file_path))
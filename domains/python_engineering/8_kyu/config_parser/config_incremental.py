@@ -0,0 +1,178 @@
+from dataclasses import dataclass, field
+from itertools import compress, count, islice
+from operator import attrgetter, ne
+from typing import Any, Iterable
+
+from config_diagnostics import Diagnostics, Reason
+from config_parser import parse_line
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class ConfigDiff:
+    """Keys that differ between two successive loads of a config file."""
+    added: dict[str, Any] = field(default_factory=dict)
+    removed: dict[str, Any] = field(default_factory=dict)
+    # key -> (old value, new value)
+    changed: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+class _Entry:
+    # compared by identity so equal lines stay distinct occurrences
+    __slots__ = ("key", "value", "line")
+
+    def __init__(self, key: str, value: Any, line: int):
+        self.key = key
+        self.value = value
+        # index into IncrementalConfigParser._entries, kept current on reload
+        self.line = line
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    # 1 == True and 1 == 1.0, but a type change is still a change
+    return type(old) is type(new) and old == new
+
+
+def _common_length(old: Iterable[int], new: Iterable[int], limit: int) -> int:
+    # position of the first mismatch, found without a python-level loop
+    mismatches = islice(map(ne, old, new), limit)
+    return next(compress(count(), mismatches), limit)
+
+
+class IncrementalConfigParser:
+    """Re-parse only the lines of a config file that changed since last load.
+
+    A hash of every line is kept between loads. On reload the unchanged
+    leading and trailing lines are skipped and only the edited range in
+    between is tokenized, so the parsing cost follows the size of the edit.
+    Duplicate keys keep the last-write-wins behavior of parse_config, and
+    config keeps its key order: by first occurrence in the file.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.config: dict[str, Any] = {}
+        self.lines_reparsed = 0
+        self._line_hashes: list[int] = []
+        # one slot per line, None for blank, comment and invalid lines
+        self._entries: list[_Entry | None] = []
+        # every occurrence of a key in file order, the last one wins
+        self._occurrences: dict[str, list[_Entry]] = {}
+
+    def load(self) -> ConfigDiff:
+        """Bring config up to date with the file and report what changed.
+
+        Returns:
+            Diff of added, removed and changed keys since the previous load
+            (everything is "added" on the first load)
+
+        Raises:
+            FileNotFoundError: If the specified file doesn't exist
+        """
+        with open(self.file_path) as file:
+            lines = file.readlines()
+        line_hashes = list(map(hash, lines))
+        old_hashes = self._line_hashes
+        if line_hashes == old_hashes:
+            self.lines_reparsed = 0
+            return ConfigDiff()
+
+        # narrow the edit down to the range between the common prefix and suffix
+        limit = min(len(old_hashes), len(line_hashes))
+        start = _common_length(old_hashes, line_hashes, limit)
+        suffix = _common_length(reversed(old_hashes), reversed(line_hashes), limit - start)
+        old_end = len(old_hashes) - suffix
+        new_end = len(line_hashes) - suffix
+
+        diagnostics = Diagnostics()
+        raw_line = ""
+        def on_invalid(reason: Reason, line_no: int) -> None:
+            # byte offsets would need the unchanged prefix measured, so only the text is kept
+            diagnostics.record(reason, line_no, -1, raw_line.strip())
+        new_entries = []
+        for line_no, raw_line in enumerate(lines[start:new_end], start + 1):
+            entry = parse_line(raw_line, line_no, on_invalid)
+            new_entries.append(None if entry is None else _Entry(entry[0], entry[1], line_no - 1))
+        # only the re-parsed lines are reported
+        diagnostics.finish(self.file_path)
+        # state only changes once the edited range parsed cleanly
+        self._line_hashes = line_hashes
+        removed_entries = self._entries[start:old_end]
+        self._entries[start:old_end] = new_entries
+        if new_end != old_end:
+            # the unchanged suffix moved, the prefix never does
+            shift = new_end - old_end
+            for entry in self._entries[new_end:]:
+                if entry is not None:
+                    entry.line += shift
+        self.lines_reparsed = new_end - start
+        return self._apply(start, removed_entries, new_entries)
+
+    def _first_line(self, key: str) -> int:
+        return self._occurrences[key][0].line
+
+    def _apply(self, prefix_end: int, removed_entries: list[_Entry | None],
+               new_entries: list[_Entry | None]) -> ConfigDiff:
+        removed_ids = {id(entry) for entry in removed_entries if entry is not None}
+        added_by_key: dict[str, list[_Entry]] = {}
+        for entry in new_entries:
+            if entry is not None:
+                added_by_key.setdefault(entry.key, []).append(entry)
+        # keys new to config only occur in new_entries, so this visits them,
+        # and fills diff.added, in file order
+        affected_keys = dict.fromkeys(added_by_key)
+        affected_keys.update((entry.key, None) for entry in removed_entries if entry is not None)
+
+        diff = ConfigDiff()
+        # set once a remaining key's first occurrence is a different entry
+        reorder = False
+        for key in affected_keys:
+            kept = [entry for entry in self._occurrences.get(key, ()) if id(entry) not in removed_ids]
+            added = added_by_key.get(key, [])
+            # new occurrences slot in after those in the unchanged prefix
+            split = 0
+            if added and kept:
+                # kept is in file order, so binary search for the boundary
+                high = len(kept)
+                while split < high:
+                    middle = (split + high) // 2
+                    if kept[middle].line < prefix_end:
+                        split = middle + 1
+                    else:
+                        high = middle
+            occurrences = kept[:split] + added + kept[split:]
+
+            old_value = self.config.get(key, _MISSING)
+            if occurrences:
+                previous = self._occurrences.get(key)
+                self._occurrences[key] = occurrences
+                new_value = occurrences[-1].value
+                if old_value is _MISSING:
+                    diff.added[key] = new_value
+                    continue
+                self.config[key] = new_value
+                reorder = reorder or occurrences[0] is not previous[0]
+                if not _same_value(old_value, new_value):
+                    diff.changed[key] = (old_value, new_value)
+            else:
+                del self._occurrences[key]
+                del self.config[key]
+                diff.removed[key] = old_value
+
+        # config is ordered by first line, so new keys that all come after the
+        # last key's first line can simply be appended
+        config = self.config
+        if diff.added and config and not reorder:
+            reorder = self._first_line(next(iter(diff.added))) < self._first_line(next(reversed(config)))
+        config.update(diff.added)
+        if reorder:
+            # rebuilt from the entries, which are in file order
+            order = list(dict.fromkeys(map(attrgetter("key"), filter(None, self._entries))))
+            values = list(map(config.__getitem__, order))
+            config.clear()
+            config.update(zip(order, values))
+        return diff
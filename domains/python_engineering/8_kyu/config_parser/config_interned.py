@@ -0,0 +1,132 @@
+from collections.abc import Mapping
+from typing import Any, Iterable, Iterator
+import sys
+import threading
+
+from config_diagnostics import Diagnostics
+from config_parser import Engine, loads, parse_config
+
+
+class _Shape:
+    """Key sequence shared by every config with the same keys in the same order."""
+
+    __slots__ = ("keys", "index")
+
+    def __init__(self, keys: tuple[str, ...]):
+        self.keys = keys
+        self.index = {key: slot for slot, key in enumerate(keys)}
+
+
+class SharedConfig(Mapping):
+    """Read-only config whose keys live in a shape shared with similar configs.
+
+    Each instance only owns a tuple of values; the key lookup table and
+    every string are owned by the InterningLoader that created it.
+    """
+
+    __slots__ = ("_shape", "_values")
+
+    def __init__(self, shape: _Shape, values: tuple[Any, ...]):
+        self._shape = shape
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._shape.index[key]]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._shape.index
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._shape.keys)
+
+    def __repr__(self) -> str:
+        return f"SharedConfig({dict(self)!r})"
+
+
+class InterningLoader:
+    """Load many configs so that they share keys, key tables and values.
+
+    Every key and string value is replaced by one pooled instance, and
+    configs with the same keys in the same order share one shape (the key
+    tuple and its lookup table), much like CPython's key-sharing dicts. A
+    config then costs one small object plus a tuple of value references.
+
+    The pools only grow, as configs don't report when they are dropped;
+    clear() starts over without affecting configs already loaded.
+    """
+
+    def __init__(self, engine: str = Engine.TEXT):
+        self.engine = engine
+        self._strings: dict[str, str] = {}
+        # ints apart from str: a mixed pool would merge 1, 1.0 and True
+        self._ints: dict[int, int] = {}
+        self._shapes: dict[tuple[str, ...], _Shape] = {}
+        self._lock = threading.Lock()
+
+    def load(self, file_path: str, diagnostics: Diagnostics | None = None) -> SharedConfig:
+        """Parse a file with parse_config and intern the result.
+
+        Raises:
+            FileNotFoundError: If the specified file doesn't exist
+        """
+        return self.intern(parse_config(file_path, self.engine, diagnostics=diagnostics))
+
+    def loads(self, data: str | bytes | bytearray | memoryview,
+              diagnostics: Diagnostics | None = None) -> SharedConfig:
+        """Parse in-memory config with loads() and intern the result."""
+        return self.intern(loads(data, diagnostics=diagnostics))
+
+    def intern(self, config: Mapping[str, Any]) -> SharedConfig:
+        """Return a SharedConfig equal to config, built from pooled objects."""
+        strings = self._strings
+        ints = self._ints
+        with self._lock:
+            keys = tuple([strings.setdefault(key, key) for key in config])
+            values = []
+            for value in config.values():
+                # exact type checks, bool is an int subclass and stays as is
+                if type(value) is str:
+                    value = strings.setdefault(value, value)
+                elif type(value) is int:
+                    value = ints.setdefault(value, value)
+                values.append(value)
+            shape = self._shapes.get(keys)
+            if shape is None:
+                shape = self._shapes[keys] = _Shape(keys)
+        return SharedConfig(shape, tuple(values))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._strings.clear()
+            self._ints.clear()
+            self._shapes.clear()
+
+    def memory_usage(self, configs: Iterable[SharedConfig] = ()) -> dict[str, int]:
+        """Approximate bytes held by the pools and, if given, by configs.
+
+        Counts are shallow sys.getsizeof() sums, so they are comparable with
+        each other rather than exact RSS.
+        """
+        with self._lock:
+            usage = {
+                "strings": len(self._strings),
+                "string_bytes": sum(map(sys.getsizeof, self._strings)),
+                "ints": len(self._ints),
+                "int_bytes": sum(map(sys.getsizeof, self._ints)),
+                "shapes": len(self._shapes),
+                "shape_bytes": sum(sys.getsizeof(shape) + sys.getsizeof(shape.keys)
+                                   + sys.getsizeof(shape.index) for shape in self._shapes.values()),
+            }
+        config_count = 0
+        config_bytes = 0
+        for config in configs:
+            config_count += 1
+            config_bytes += sys.getsizeof(config) + sys.getsizeof(config._values)
+        usage["configs"] = config_count
+        usage["config_bytes"] = config_bytes
+        usage["total_bytes"] = (usage["string_bytes"] + usage["int_bytes"]
+                                + usage["shape_bytes"] + config_bytes)
+        return usage
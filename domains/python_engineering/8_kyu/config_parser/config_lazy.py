@@ -0,0 +1,141 @@
+from array import array
+from collections.abc import Mapping
+from typing import Any, Iterator
+import locale
+import mmap
+import os
+
+from config_diagnostics import Diagnostics
+from config_parser import convert_value, get_value_type, has_lone_cr, parse_config, scan_entries
+
+# unused position in ConfigView's slot table
+_EMPTY = -1
+
+
+class ConfigView(Mapping):
+    """Read-only mapping that types each value the first time it is read.
+
+    Only keys are decoded up front. For every key the view keeps just the
+    byte offset its value starts at in a compact array; the value runs to
+    the end of its line. Keys are found through an open addressing table
+    of slot numbers in another array, so no object is allocated per key
+    besides the key itself, as a dict of key -> slot would. Values are
+    classified and converted on first access and memoized in a dict
+    holding only the values read so far, so an untouched view is smaller
+    than the dict parse_config returns.
+    """
+
+    __slots__ = ("_buffer", "_encoding", "_keys", "_starts", "_table", "_values")
+
+    def __init__(self, buffer: bytes | mmap.mmap, encoding: str,
+                 diagnostics: Diagnostics | None = None):
+        self._buffer = buffer
+        self._encoding = encoding
+        # keys in parse_config order, and where the value of each starts
+        self._keys: list[str] = []
+        self._starts = array("Q")
+        self._table = array("i", [_EMPTY]) * 8
+        self._values: dict[str, Any] = {}
+        keys = self._keys
+        starts = self._starts
+        on_invalid = diagnostics.record if diagnostics is not None else None
+        for key, value_start, _, _ in scan_entries(buffer, encoding, on_invalid):
+            position = self._find(key)
+            slot = self._table[position]
+            if slot == _EMPTY:
+                self._table[position] = len(keys)
+                keys.append(key)
+                starts.append(value_start)
+                if 2 * len(keys) > len(self._table):
+                    self._rebuild(2 * len(self._table))
+            else:
+                # duplicate key, last write wins
+                starts[slot] = value_start
+
+    @classmethod
+    def from_dict(cls, config: dict[str, Any]) -> "ConfigView":
+        """Wrap already converted values, for input the byte scanner can't split."""
+        view = cls(b"", "utf-8")
+        view._keys = list(config)
+        view._rebuild(max(8, 1 << (2 * len(config)).bit_length()))
+        view._values = dict(config)
+        return view
+
+    def _find(self, key: object) -> int:
+        # linear probing, the table is kept at most half full
+        table = self._table
+        keys = self._keys
+        mask = len(table) - 1
+        position = hash(key) & mask
+        while True:
+            slot = table[position]
+            if slot == _EMPTY or keys[slot] == key:
+                return position
+            position = (position + 1) & mask
+
+    def _rebuild(self, size: int) -> None:
+        self._table = array("i", [_EMPTY]) * size
+        for slot, key in enumerate(self._keys):
+            self._table[self._find(key)] = slot
+
+    def __getitem__(self, key: str) -> Any:
+        values = self._values
+        if key in values:
+            return values[key]
+        slot = self._table[self._find(key)]
+        if slot == _EMPTY:
+            raise KeyError(key)
+        start = self._starts[slot]
+        end = self._buffer.find(b"\n", start)
+        if end == -1:
+            end = len(self._buffer)
+        value_token = self._buffer[start:end].decode(self._encoding).strip()
+        value = values[key] = convert_value(value_token, get_value_type(value_token))
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return self._table[self._find(key)] != _EMPTY
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def close(self) -> None:
+        """Release the mapped file; values already read stay available."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> "ConfigView":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def parse_config_lazy(file_path: str, diagnostics: Diagnostics | None = None) -> ConfigView:
+    """Parse a configuration file, deferring value typing until lookup.
+
+    Invalid lines are still reported to diagnostics while the keys are
+    scanned, see parse_config.
+
+    Returns:
+        ConfigView equal to parse_config(file_path) as a mapping
+
+    Raises:
+        FileNotFoundError: If the specified file doesn't exist
+    """
+    if diagnostics is None:
+        diagnostics = Diagnostics()
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return ConfigView(b"", "utf-8")
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if has_lone_cr(buffer):
+        # text mode splits lines on a lone \r, which byte offsets can't follow
+        buffer.close()
+        return ConfigView.from_dict(parse_config(file_path, diagnostics=diagnostics))
+    view = ConfigView(buffer, locale.getpreferredencoding(False), diagnostics)
+    diagnostics.finish(file_path)
+    return view
@@ -1,7 +1,18 @@
-from typing import Any
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, IO, Iterable, Iterator
 from enum import Enum
+import io
+import locale
 import logging
+import mmap
+import os
 import re
+import time
+
+from config_diagnostics import Diagnostics, Reason
+from config_stats import BLANK, COMMENT, INVALID, ParseStats
 
 class ValueType(str, Enum):
     SINGLE_QUOTE = "SINGLE_QUOTE"
@@ -12,40 +23,46 @@ class ValueType(str, Enum):
     BOOL = "BOOL"
     INVALID = "INVALID"
 
+class Engine(str, Enum):
+    TEXT = "text"
+    MMAP = "mmap"
+
+# bytes.strip() whitespace; str.strip() also treats 0x1c-0x1f and non-ascii
+# code points as whitespace, so lines starting with those take the str path
+_ASCII_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+_HASH = ord("#")
+_LONE_CR = re.compile(rb"\r(?!\n)")
+# searched with a pattern rather than bytes.find(), which memoryview lacks
+_NEWLINE = re.compile(rb"\n")
+# the buffer engine decodes and splits this many bytes at a time, plus the
+# rest of the line the block ends in
+_BLOCK_SIZE = 1 << 16
+# smaller files parse faster than worker processes start up
+MIN_PARALLEL_BYTES = 1 << 20
+
+# one anchored pass decides the type, the matching group names the ValueType
+_VALUE_PATTERN = re.compile(r"""
+    (?P<DOUBLE_QUOTE>"[^"]*"\Z)
+  | (?P<SINGLE_QUOTE>'[^']*'\Z)
+  | (?P<BOOL>(?:[Tt][Rr][Uu][Ee]|[Ff][Aa][Ll][Ss][Ee])\Z)
+  | (?P<INT>-?\d+$)
+  | (?P<FLOAT>(?!\.\Z)-?\d*\.\d*$)
+""", re.VERBOSE)
+_GROUP_TYPES = {value_type.value: value_type for value_type in ValueType}
+
 def get_value_type(value_token: str) -> ValueType:
-    if not len(value_token):
-        # handle empty line
+    # empty values, broken quotes and anything else unmatched are strings
+    match = _VALUE_PATTERN.match(value_token)
+    if match is None:
         return ValueType.STRING
-    
-    # check for literal
-    quote_types = [("\"", ValueType.DOUBLE_QUOTE), ("'", ValueType.SINGLE_QUOTE)]
-    for quote_token, quote_value_type in quote_types:
-        if value_token[0] == quote_token:
-            # quote string detected
-            if value_token.count(quote_token) != 2 or value_token[-1] != quote_token:
-                # invalid quote parity or syntax, Interpret as string
-                return ValueType.STRING
-            return quote_value_type
-    
-    # check for bool
-    value_lower = value_token.lower()
-    if value_lower == "true" or value_lower == "false":
-        return ValueType.BOOL
-    
-    # check for int
-    if re.match(r"^-?\d+$", value_token):
-        return ValueType.INT
-    
-    # check for float
-    if value_token != "." and re.match(r"^-?\d*\.\d*$", value_token):
-        return ValueType.FLOAT
-    
-    # default assume string type
-    return ValueType.STRING
+    return _GROUP_TYPES[match.lastgroup]
 
 
-def log_invalid_format(line: str):
-    msg = f"invalid format for line: {line}"
+def log_invalid_format(line: str, line_no: int | None = None):
+    if line_no is None:
+        msg = f"invalid format for line: {line}"
+    else:
+        msg = f"invalid format for line {line_no}: {line}"
     logging.warning(msg)
 
 def parse_line_tokens(line: str):
@@ -55,11 +72,447 @@ def parse_line_tokens(line: str):
     return key, value
 
 
-def parse_config(file_path: str) -> dict[str, Any]:
+_CONVERTERS = {
+    # remove leading and trailing quotes ""
+    ValueType.SINGLE_QUOTE: lambda token: token[1:-1],
+    ValueType.DOUBLE_QUOTE: lambda token: token[1:-1],
+    ValueType.INT: int,
+    ValueType.FLOAT: float,
+    ValueType.BOOL: lambda token: token.lower() == "true",
+}
+
+# by _VALUE_PATTERN group name
+_GROUP_CONVERTERS = {value_type.value: converter for value_type, converter in _CONVERTERS.items()}
+
+def convert_value(value_token: str, value_type: ValueType) -> Any:
+    converter = _CONVERTERS.get(value_type)
+    if converter is None:
+        return value_token
+    return converter(value_token)
+
+
+InvalidLineHandler = Callable[[Reason, int], None]
+
+def parse_line(raw_line: str, line_no: int | None = None,
+               on_invalid: InvalidLineHandler | None = None) -> tuple[str, Any] | None:
+    """Parse one raw line into a typed (key, value) pair.
+    
+    Returns None for empty lines, comments and lines without "=". Invalid
+    lines are passed to on_invalid(reason, line_no), e.g. a Diagnostics
+    recorder, or logged one by one when no handler is given.
+    """
+    line = raw_line.strip()
+    # skip if line is empty or comment
+    if line == "" or line[0] == "#":
+        return None
+    # log if = not present in line
+    if "=" not in line:
+        if on_invalid is None:
+            log_invalid_format(line, line_no)
+        else:
+            on_invalid(Reason.MISSING_SEPARATOR, line_no)
+        return None
+    # parse key, value tokens
+    key_token, value_token = parse_line_tokens(line)
+    value_type = get_value_type(value_token)
+    if value_type == ValueType.INVALID:
+        if on_invalid is None:
+            log_invalid_format(line, line_no)
+        else:
+            on_invalid(Reason.INVALID_VALUE, line_no)
+    return key_token, convert_value(value_token, value_type)
+
+
+def _iter_line_entries(lines: Iterable[str], diagnostics: Diagnostics,
+                       encoding: str) -> Iterator[tuple[str, Any, int]]:
+    # lines keep their own line breaks (newline=""), so summing their encoded
+    # lengths gives the byte offset of each invalid line as it is recorded
+    record = diagnostics.record
+    offset = 0
+    raw_line = ""
+    def on_invalid(reason: Reason, line_no: int) -> None:
+        record(reason, line_no, offset, raw_line.strip())
+    for line_no, raw_line in enumerate(lines, 1):
+        entry = parse_line(raw_line, line_no, on_invalid)
+        if entry is not None:
+            yield entry[0], entry[1], line_no
+        offset += len(raw_line) if raw_line.isascii() else len(raw_line.encode(encoding))
+
+
+def _iter_text_entries(file_path: str, diagnostics: Diagnostics) -> Iterator[tuple[str, Any, int]]:
+    # newline="" still splits on \n, \r and \r\n, it just leaves them in place
+    with open(file_path, newline="") as file:
+        yield from _iter_line_entries(file, diagnostics, file.encoding)
+    diagnostics.finish(file_path)
+
+
+def _iter_text_entries_profiled(file_path: str, diagnostics: Diagnostics,
+                                stats: ParseStats) -> Iterator[tuple[str, Any, int]]:
+    # the text engine loop with a clock read between phases, kept separate
+    # so parsing without stats doesn't pay for any of it
+    clock = time.perf_counter_ns
+    line_counts = stats.line_counts
+    on_line = stats.on_line
+    with open(file_path, newline="") as file:
+        lines = iter(file)
+        encoding = file.encoding
+        line_no = 0
+        offset = 0
+        while True:
+            started = clock()
+            raw_line = next(lines, None)
+            read = clock()
+            stats.read_ns += read - started
+            if raw_line is None:
+                break
+            line_no += 1
+            entry = None
+            line = raw_line.strip()
+            if line == "":
+                category = BLANK
+            elif line[0] == "#":
+                category = COMMENT
+            elif "=" not in line:
+                category = INVALID
+                diagnostics.record(Reason.MISSING_SEPARATOR, line_no, offset, line)
+            else:
+                key_token, value_token = parse_line_tokens(line)
+                tokenized = clock()
+                value_type = get_value_type(value_token)
+                classified = clock()
+                entry = key_token, convert_value(value_token, value_type), line_no
+                converted = clock()
+                category = value_type.value
+                stats.tokenize_ns += tokenized - read
+                stats.classify_ns += classified - tokenized
+                stats.convert_ns += converted - classified
+            if entry is None:
+                stats.tokenize_ns += clock() - read
+            line_counts[category] += 1
+            if on_line is not None:
+                on_line(category, line_no)
+            if entry is not None:
+                yield entry
+            offset += len(raw_line) if raw_line.isascii() else len(raw_line.encode(encoding))
+        stats.bytes_read += file.buffer.tell()
+    stats.files += 1
+    diagnostics.finish(file_path)
+    if stats.on_finish is not None:
+        stats.on_finish(stats)
+
+
+def has_lone_cr(buf: bytes | mmap.mmap | memoryview) -> bool:
+    """True if buf has a "\r" that isn't part of "\r\n", which text mode
+    treats as a line break of its own."""
+    return _LONE_CR.search(buf) is not None
+
+
+def scan_entries(buf: bytes | mmap.mmap, encoding: str,
+                 on_invalid: Callable[[Reason, int, int, str], None] | None = None) -> Iterator[tuple[str, int, int, int]]:
+    """Locate the entries of a raw config buffer without decoding values.
+    
+    Lines are split on "\n" only, so buffers containing a lone "\r" must be
+    handled by the text engine instead. Lines without "=" are passed to
+    on_invalid(reason, line_no, line_offset, line), or logged when it is None.
+    
+    Yields:
+        (key, value_start, value_end, line_no) for every key/value line, where
+        buf[value_start:value_end] holds the still unstripped value bytes
+    """
+    size = len(buf)
+    start = 0
+    line_no = 0
+    while start < size:
+        end = buf.find(b"\n", start)
+        if end == -1:
+            end = size
+        line_start = start
+        next_start = end + 1
+        line_no += 1
+        # skip leading whitespace without copying the line
+        while start < end and buf[start] in _ASCII_WHITESPACE:
+            start += 1
+        if start == end or buf[start] == _HASH:
+            start = next_start
+            continue
+        if buf[start] >= 0x80 or 0x1c <= buf[start] <= 0x1f:
+            # possible unicode whitespace, let str.strip() decide
+            line = str(buf[start:end], encoding).strip()
+            if line == "" or line[0] == "#":
+                start = next_start
+                continue
+        split_index = buf.find(b"=", start, end)
+        if split_index == -1:
+            line = str(buf[start:end], encoding).strip()
+            if on_invalid is None:
+                log_invalid_format(line, line_no)
+            else:
+                on_invalid(Reason.MISSING_SEPARATOR, line_no, line_start, line)
+            start = next_start
+            continue
+        # decode only the key slice, the value is left to the caller
+        key_token = str(buf[start:split_index], encoding).strip()
+        yield key_token, split_index + 1, end, line_no
+        start = next_start
+
+
+def _iter_buffer_entries(buf: bytes | mmap.mmap | memoryview, encoding: str,
+                         diagnostics: Diagnostics) -> Iterator[tuple[str, Any, int]]:
+    # parse_line inlined over whole blocks: each block is decoded and split in
+    # one call, which leaves a few str methods and one match per line. Lines
+    # are split on "\n" only, callers hand buffers with a lone "\r" to the
+    # text engine; blocks end on a line break, so no character is cut
+    record = diagnostics.record
+    match_value = _VALUE_PATTERN.match
+    converters = _GROUP_CONVERTERS
+    size = len(buf)
+    start = 0
+    lines_before = 0
+    while start < size:
+        newline = _NEWLINE.search(buf, min(start + _BLOCK_SIZE, size))
+        end = size if newline is None else newline.end()
+        block = str(buf[start:end], encoding)
+        lines = block.split("\n")
+        is_ascii = block.isascii()
+        # byte offset of the last invalid line, so the next is measured from it
+        offset = start
+        offset_index = 0
+        for index, raw_line in enumerate(lines):
+            line = raw_line.strip()
+            if not line or line[0] == "#":
+                continue
+            key_token, separator, value_token = line.partition("=")
+            if not separator:
+                skipped = lines[offset_index:index]
+                if is_ascii:
+                    offset += sum(map(len, skipped)) + len(skipped)
+                elif skipped:
+                    offset += len("\n".join(skipped).encode(encoding)) + 1
+                offset_index = index
+                record(Reason.MISSING_SEPARATOR, lines_before + index + 1, offset, line)
+                continue
+            # line is stripped already, so each token has only one open side
+            value_token = value_token.lstrip()
+            match = match_value(value_token)
+            value = value_token if match is None else converters[match.lastgroup](value_token)
+            yield key_token.rstrip(), value, lines_before + index + 1
+        # a block ending in "\n" splits into one more, empty, string than it has lines
+        lines_before += len(lines) - block.endswith("\n")
+        start = end
+
+
+def _iter_mmap_entries(file_path: str, diagnostics: Diagnostics) -> Iterator[tuple[str, Any, int]]:
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # empty files can't be mapped
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            if has_lone_cr(buf):
+                # text mode treats a lone \r as a line break, defer to it
+                yield from _iter_text_entries(file_path, diagnostics)
+                return
+            # same codec open() uses in text mode
+            yield from _iter_buffer_entries(buf, locale.getpreferredencoding(False), diagnostics)
+    diagnostics.finish(file_path)
+
+
+def _project_buffer(buf: bytes | mmap.mmap, keys: Iterable[str], encoding: str) -> dict[str, Any]:
+    # walk lines from the end, so the first occurrence found of a key is its
+    # last write; line numbers are unknown, so nothing goes to diagnostics
+    wanted = dict.fromkeys(keys)
+    remaining = set(wanted)
+    found = {}
+    end = len(buf)
+    newline = buf.rfind(b"\n", 0, end)
+    # a lone \r ends a line in text mode; splitting \r\n in two only adds a
+    # blank line, and blank lines don't matter here
+    carriage_return = buf.rfind(b"\r", 0, end)
+    while remaining:
+        # each rfind is repeated only once its last hit has been passed
+        if newline >= end:
+            newline = buf.rfind(b"\n", 0, end)
+        if carriage_return >= end:
+            carriage_return = buf.rfind(b"\r", 0, end)
+        line_break = max(newline, carriage_return)
+        start = line_break + 1
+        while start < end and buf[start] in _ASCII_WHITESPACE:
+            start += 1
+        if start < end and buf[start] != _HASH:
+            skip = False
+            if buf[start] >= 0x80 or 0x1c <= buf[start] <= 0x1f:
+                # possible unicode whitespace, let str.strip() decide
+                line = str(buf[start:end], encoding).strip()
+                skip = line == "" or line[0] == "#"
+            split_index = -1 if skip else buf.find(b"=", start, end)
+            if split_index != -1:
+                key_token = str(buf[start:split_index], encoding).strip()
+                if key_token in remaining:
+                    value_token = str(buf[split_index + 1:end], encoding).strip()
+                    found[key_token] = convert_value(value_token, get_value_type(value_token))
+                    remaining.discard(key_token)
+        if line_break < 0:
+            break
+        end = line_break
+    return {key: found[key] for key in wanted if key in found}
+
+
+def _project_config(file_path: str, keys: Iterable[str]) -> dict[str, Any]:
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return {}
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return _project_buffer(buf, keys, locale.getpreferredencoding(False))
+
+
+def iter_config(file_path: str, engine: str = Engine.TEXT,
+                diagnostics: Diagnostics | None = None,
+                stats: ParseStats | None = None) -> Iterator[tuple[str, Any, int]]:
+    """Stream typed entries from a configuration file one line at a time.
+    
+    Only the current line is held in memory, so arbitrarily large files can
+    be consumed with flat memory usage.
+    
+    Args:
+        file_path: Path to the configuration file
+        engine: "text" reads decoded lines, "mmap" maps the file and
+            decodes and splits it in blocks of about 64 KiB, which is
+            faster and holds one block rather than one line at a time
+        diagnostics: Collector for invalid lines; a default one logs a
+            single summary warning once the file is exhausted
+        stats: ParseStats to fill with per-phase timings and line counts,
+            supported by the text engine only
+        
+    Yields:
+        (key, value, line_no) tuples in file order, with values converted to
+        appropriate types and line_no counting from 1
+        
+    Raises:
+        FileNotFoundError: If the specified file doesn't exist
+        ValueError: If engine is not a known engine name
+    """
+    if diagnostics is None:
+        diagnostics = Diagnostics()
+    if stats is not None:
+        if Engine(engine) != Engine.TEXT:
+            raise ValueError("stats are only collected by the text engine")
+        return _iter_text_entries_profiled(file_path, diagnostics, stats)
+    match Engine(engine):
+        case Engine.MMAP:
+            return _iter_mmap_entries(file_path, diagnostics)
+        case _:
+            return _iter_text_entries(file_path, diagnostics)
+
+
+def _chunk_ranges(file_path: str, size: int, chunks: int) -> list[tuple[int, int]]:
+    # split into byte ranges that each end right after a newline
+    offsets = [0]
+    with open(file_path, "rb") as file:
+        for index in range(1, chunks):
+            target = size * index // chunks
+            if target <= offsets[-1]:
+                continue
+            file.seek(target - 1)
+            file.readline()
+            offset = file.tell()
+            if offset >= size:
+                break
+            offsets.append(offset)
+    offsets.append(size)
+    return list(zip(offsets, offsets[1:]))
+
+
+class _RangeReader(io.RawIOBase):
+    """Raw reader over the next length bytes of a binary file, then EOF."""
+
+    def __init__(self, file: IO[bytes], length: int):
+        self._file = file
+        self._remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: memoryview) -> int:
+        if self._remaining <= 0:
+            return 0
+        with memoryview(buffer) as view:
+            count = self._file.readinto(view[:min(len(view), self._remaining)])
+        self._remaining -= count
+        return count
+
+
+def _parse_chunk(file_path: str, start: int, end: int,
+                 examples: int) -> tuple[dict[str, Any], int, bytearray, array, array, list[str]]:
+    encoding = locale.getpreferredencoding(False)
+    # every invalid line goes back to the parent, which does the sampling;
+    # only the first few can end up quoted, so only their text is kept
+    reasons = bytearray()
+    line_nos = array("q")
+    offsets = array("q")
+    texts = []
+    raw_line = ""
+    def record_invalid(reason: Reason, line_no: int) -> None:
+        if len(reasons) < examples:
+            texts.append(raw_line.strip())
+        reasons.append(reason)
+        line_nos.append(line_no)
+        offsets.append(offset)
+    chunk_dict = {}
+    line_no = 0
+    offset = start
+    with open(file_path, "rb", buffering=0) as file:
+        file.seek(start)
+        # streamed a buffer at a time like open(), never holding the whole
+        # range; newline="" gives its line splitting and keeps the breaks
+        with io.TextIOWrapper(io.BufferedReader(_RangeReader(file, end - start)),
+                              encoding, newline="") as lines:
+            for line_no, raw_line in enumerate(lines, 1):
+                entry = parse_line(raw_line, line_no, record_invalid)
+                if entry is not None:
+                    chunk_dict[entry[0]] = entry[1]
+                offset += len(raw_line) if raw_line.isascii() else len(raw_line.encode(encoding))
+    return chunk_dict, line_no, reasons, line_nos, offsets, texts
+
+
+def _parse_config_parallel(file_path: str, workers: int, diagnostics: Diagnostics) -> dict[str, Any]:
+    size = os.path.getsize(file_path)
+    ranges = _chunk_ranges(file_path, size, workers)
+    config_dict = {}
+    lines_before = 0
+    # enough text for every line the summary could quote, whichever chunk it is in
+    examples = diagnostics.examples * diagnostics.sample_every
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        starts = [start for start, _ in ranges]
+        ends = [end for _, end in ranges]
+        # map() hands results back in chunk order, so merging with update()
+        # keeps both the key order and last-write-wins of a sequential parse
+        results = pool.map(_parse_chunk, repeat(file_path), starts, ends, repeat(examples))
+        for chunk_dict, line_count, reasons, line_nos, offsets, texts in results:
+            for index, (reason, line_no, offset) in enumerate(zip(reasons, line_nos, offsets)):
+                text = texts[index] if index < len(texts) else None
+                diagnostics.record(reason, lines_before + line_no, offset, text)
+            config_dict.update(chunk_dict)
+            lines_before += line_count
+    diagnostics.finish(file_path)
+    return config_dict
+
+
+def parse_config(file_path: str, engine: str = Engine.TEXT, workers: int = 1,
+                 diagnostics: Diagnostics | None = None,
+                 stats: ParseStats | None = None,
+                 keys: Iterable[str] | None = None) -> dict[str, Any]:
     """Parse a configuration file and return its contents as a dictionary.
     
     Args:
         file_path: Path to the configuration file
+        engine: Parsing engine, "text" (default) or "mmap"
+        workers: Number of processes to split large files across; chunks
+            are parsed with the text engine rules and merged in file order
+        diagnostics: Collector for invalid lines, see iter_config
+        stats: ParseStats to fill, see iter_config; always parsed in-process
+        keys: Only return these keys. The file is then scanned backwards
+            from its end and reading stops once every key has been seen,
+            so invalid lines are not reported and engine, workers and
+            diagnostics are ignored
         
     Returns:
         Dictionary containing the parsed configuration with values converted to 
@@ -67,37 +520,75 @@ def parse_config(file_path: str) -> dict[str, Any]:
         
     Raises:
         FileNotFoundError: If the specified file doesn't exist
+        ValueError: If engine is not a known engine name, or keys is
+            combined with stats
+        TypeError: If keys is a single str rather than an iterable of keys
     """
+    Engine(engine)
+    if keys is not None:
+        # a bare str would be taken as its characters
+        if isinstance(keys, str):
+            raise TypeError("keys must be an iterable of key names, not a str")
+        if stats is not None:
+            raise ValueError("stats can't be collected for a keys projection")
+        return _project_config(file_path, keys)
+    if diagnostics is None:
+        diagnostics = Diagnostics()
+    if workers > 1 and stats is None and os.path.getsize(file_path) >= MIN_PARALLEL_BYTES:
+        return _parse_config_parallel(file_path, workers, diagnostics)
     config_dict = {}
-    with open(file_path) as file:
-        raw_lines = file.readlines()
-        for raw_line in raw_lines:
-            line = raw_line.strip()
-            # skip if line is empty or comment
-            if line == "" or line[0] == "#":
-                continue
-            # log if = not present in line
-            if "=" not in line:
-                log_invalid_format(line)
-                continue
-            # parse key, value tokens
-            key_token, value_token = parse_line_tokens(line)
-            match get_value_type(value_token):
-                case ValueType.SINGLE_QUOTE | ValueType.DOUBLE_QUOTE:
-                    # remove leading and trailing quotes ""
-                    value = value_token[1:-1]
-                case ValueType.STRING:
-                    value = value_token
-                case ValueType.INT:
-                    value = int(value_token)
-                case ValueType.FLOAT:
-                    value = float(value_token)
-                case ValueType.BOOL:
-                    value = True if value_token.lower() == "true" else False
-                case ValueType.INVALID:
-                    log_invalid_format(line)
-            # key is just the key_token
-            # value is the parsed value based on matched value type
-            key, value = key_token, value
-            config_dict[key] = value
+    # later duplicates overwrite earlier ones (last write wins)
+    for key, value, _ in iter_config(file_path, engine, diagnostics, stats):
+        config_dict[key] = value
+    return config_dict
+
+
+def loads(data: str | bytes | bytearray | memoryview, encoding: str | None = None,
+          diagnostics: Diagnostics | None = None) -> dict[str, Any]:
+    """Parse configuration held in memory, with the same rules as parse_config.
+    
+    Byte buffers are read through a memoryview, without a copy of the
+    whole input, but like the mmap engine they are decoded and split into
+    lines about 64 KiB at a time, so at most one block is held as text.
+    
+    Args:
+        data: Configuration text, or its encoded bytes
+        encoding: Codec for byte input, defaults to the one open() uses
+        diagnostics: Collector for invalid lines, see iter_config; the
+            summary names the source "<string>"
+        
+    Returns:
+        Dictionary equal to parse_config() of a file holding data
+        
+    Raises:
+        TypeError: If data is a memoryview that isn't C-contiguous
+    """
+    if diagnostics is None:
+        diagnostics = Diagnostics()
+    if encoding is None:
+        encoding = locale.getpreferredencoding(False)
+    if isinstance(data, str):
+        # newline="" splits lines exactly like open() in text mode; offsets
+        # are those of data encoded with encoding
+        entries = _iter_line_entries(io.StringIO(data, newline=""), diagnostics, encoding)
+    else:
+        buf = memoryview(data).cast("B")
+        if has_lone_cr(buf):
+            # same fallback as the mmap engine
+            entries = _iter_line_entries(io.StringIO(str(buf, encoding), newline=""), diagnostics, encoding)
+        else:
+            entries = _iter_buffer_entries(buf, encoding, diagnostics)
+    config_dict = {}
+    for key, value, _ in entries:
+        config_dict[key] = value
+    diagnostics.finish("<string>")
     return config_dict
+
+
+def load(file: IO[str] | IO[bytes], encoding: str | None = None,
+         diagnostics: Diagnostics | None = None) -> dict[str, Any]:
+    """Parse configuration from an open text or binary file object.
+    
+    The object is read to the end once, see loads.
+    """
+    return loads(file.read(), encoding, diagnostics)
@@ -0,0 +1,146 @@
+from typing import Any, Callable
+import locale
+import mmap
+import os
+import re
+
+from config_parser import ValueType, get_value_type
+
+Converter = Callable[[str], Any]
+
+_LINE_BREAK = re.compile(rb"\r\n?|\n")
+
+
+def _to_bool(token: str) -> bool:
+    match token.lower():
+        case "true":
+            return True
+        case "false":
+            return False
+    raise ValueError(f"not a boolean: {token!r}")
+
+
+def _to_str(token: str) -> str:
+    # same unquoting as convert_value: only a token that is exactly one
+    # quoted run, like "a" but not "a"b", loses its quotes
+    if get_value_type(token) in (ValueType.DOUBLE_QUOTE, ValueType.SINGLE_QUOTE):
+        return token[1:-1]
+    return token
+
+
+# declared types whose converter isn't the type itself
+_CONVERTERS: dict[Any, Converter] = {
+    bool: _to_bool,
+    str: _to_str,
+}
+
+
+class SchemaError(ValueError):
+    """Raised with every problem found in one parse, not just the first."""
+
+    def __init__(self, errors: list[str]):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+class ConfigSchema:
+    """Parser specialized for a fixed set of keys, built by compile_schema."""
+
+    def __init__(self, schema: dict[str, type | Converter], defaults: dict[str, Any] | None = None,
+                 encoding: str | None = None):
+        if not schema:
+            raise ValueError("schema must declare at least one key")
+        for key in schema:
+            # a line starting with "#" is a comment, so such a key never appears
+            if not key or key != key.strip() or key[0] == "#" or "=" in key or "\n" in key:
+                raise ValueError(f"invalid key name: {key!r}")
+        self.encoding = encoding or locale.getpreferredencoding(False)
+        self.defaults = dict(defaults or {})
+        unknown = self.defaults.keys() - schema.keys()
+        if unknown:
+            raise ValueError(f"defaults for undeclared keys: {sorted(unknown)}")
+        # raw key bytes -> (key, converter), looked up once per matched line
+        self._fields = {key.encode(self.encoding): (key, _CONVERTERS.get(converter, converter))
+                        for key, converter in schema.items()}
+        self._keys = list(schema)
+        # a line matches only if, after leading whitespace, its text up to the
+        # first "=" is a declared key; every other line is skipped inside re
+        keys = b"|".join(re.escape(key) for key in sorted(self._fields, key=len, reverse=True))
+        self._pattern = re.compile(rb"(?:\A|(?<=[\r\n]))[ \t\x0b\x0c]*(" + keys
+                                   + rb")[ \t\x0b\x0c]*=([^\r\n]*)")
+
+    def _parse_buffer(self, buf: bytes | mmap.mmap | memoryview, source: str) -> dict[str, Any]:
+        fields = self._fields
+        encoding = self.encoding
+        raw_values: dict[bytes, tuple[int, bytes]] = {}
+        # last write wins, so only the final occurrence of a key is converted
+        for match in self._pattern.finditer(buf):
+            raw_values[match.group(1)] = match.start(2), match.group(2)
+        config: dict[str, Any] = {}
+        errors = []
+        for raw_key, (offset, raw_value) in raw_values.items():
+            key, converter = fields[raw_key]
+            token = str(raw_value, encoding).strip()
+            try:
+                config[key] = converter(token)
+            except (TypeError, ValueError) as error:
+                line_no = len(_LINE_BREAK.findall(buf, 0, offset)) + 1
+                errors.append(f"{source}, line {line_no}: {key}: {error}")
+        for key in self._keys:
+            if key not in config and key not in self.defaults and key.encode(encoding) not in raw_values:
+                errors.append(f"{source}: missing required key {key!r}")
+        if errors:
+            raise SchemaError(errors)
+        # declaration order, with defaults for keys the file left out
+        return {key: config[key] if key in config else self.defaults[key] for key in self._keys}
+
+    def parse(self, file_path: str) -> dict[str, Any]:
+        """Parse the declared keys of a configuration file.
+
+        Returns:
+            Dictionary holding exactly the declared keys, converted
+
+        Raises:
+            FileNotFoundError: If the specified file doesn't exist
+            SchemaError: If a value doesn't convert or a required key is missing
+        """
+        with open(file_path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return self._parse_buffer(b"", file_path)
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return self._parse_buffer(buf, file_path)
+
+    def loads(self, data: str | bytes | bytearray | memoryview) -> dict[str, Any]:
+        """Parse the declared keys of in-memory configuration, see parse."""
+        if isinstance(data, str):
+            data = data.encode(self.encoding)
+        return self._parse_buffer(memoryview(data).cast("B"), "<string>")
+
+    __call__ = parse
+
+
+def compile_schema(schema: dict[str, type | Converter], defaults: dict[str, Any] | None = None,
+                   encoding: str | None = None) -> ConfigSchema:
+    """Build a parser that reads only the keys declared in schema.
+
+    Each declared key is converted by its type instead of being guessed:
+    int, float and custom callables receive the stripped value text, bool
+    accepts true/false in any case and str drops one pair of matching
+    quotes, so "1.10" declared as str stays "1.10". Undeclared keys,
+    comments and malformed lines are skipped by a single regex pass without
+    being decoded. Whitespace around keys is matched as ASCII whitespace.
+
+    Args:
+        schema: Key -> type or converter callable, in result order
+        defaults: Values for keys that may be left out; others are required
+        encoding: Codec of the input, defaults to the one open() uses
+
+    Returns:
+        ConfigSchema whose parse(file_path) and loads(data) return dicts
+        holding exactly the declared keys
+
+    Raises:
+        ValueError: If a key can't appear in a config line or has a default
+            without being declared
+    """
+    return ConfigSchema(schema, defaults, encoding)
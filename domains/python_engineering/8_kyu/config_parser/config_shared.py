@@ -0,0 +1,188 @@
+"""
+Parsed configs shared between processes through shared memory.
+
+A ConfigPublisher parses the file once and copies its compiled snapshot
+(see config_compiled) into a new shared memory segment per generation. A
+small control segment named after the store holds the current generation:
+
+    control  magic, generation (u64)
+    data     "<name>.<generation>", one compiled snapshot
+
+ConfigReaders map the control segment, then the data segment of the
+generation it names, and look keys up in place through CompiledConfig.
+Publishing a new generation unlinks the previous data segment; readers
+that still map it keep reading it until they next call refresh().
+"""
+
+from collections.abc import Mapping
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Iterator
+import struct
+import threading
+
+from config_compiled import CompiledConfig, build_snapshot
+from config_parser import Engine
+
+_CONTROL_MAGIC = b"CFGSHM\0\0"
+_CONTROL = struct.Struct("<8sQ")
+# publishing can unlink a generation between reading the counter and mapping it
+_ATTACH_RETRIES = 100
+# held while resource_tracker.register is patched out, see _attach
+_TRACKER_LOCK = threading.Lock()
+
+
+def _segment_name(name: str, generation: int) -> str:
+    return f"{name}.{generation}"
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        pass
+    # before 3.13 attaching registers the segment with the resource tracker,
+    # which unlinks it when the reader exits; unregistering afterwards would
+    # drop the publisher's own registration when both share a tracker
+    with _TRACKER_LOCK:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name)
+        finally:
+            resource_tracker.register = register
+
+
+class ConfigPublisher:
+    """Parse a config file and publish it to readers in other processes.
+
+    Only the publisher creates or unlinks segments. close() removes them
+    all, so it has to outlive every reader that still needs to attach.
+    """
+
+    def __init__(self, name: str, file_path: str, engine: str = Engine.TEXT):
+        self.name = name
+        self.file_path = file_path
+        self.engine = engine
+        self.generation = 0
+        self._data: shared_memory.SharedMemory | None = None
+        with _TRACKER_LOCK:
+            self._control = shared_memory.SharedMemory(name, create=True, size=_CONTROL.size)
+        _CONTROL.pack_into(self._control.buf, 0, _CONTROL_MAGIC, 0)
+
+    def publish(self) -> int:
+        """Parse the file again and switch readers to the result.
+
+        Returns:
+            The generation number of the newly published config
+
+        Raises:
+            FileNotFoundError: If the config file doesn't exist
+        """
+        snapshot = build_snapshot(self.file_path, self.engine)
+        generation = self.generation + 1
+        with _TRACKER_LOCK:
+            data = shared_memory.SharedMemory(_segment_name(self.name, generation), create=True,
+                                              size=len(snapshot))
+        data.buf[:len(snapshot)] = snapshot
+        # the segment is complete before any reader can learn its name
+        _CONTROL.pack_into(self._control.buf, 0, _CONTROL_MAGIC, generation)
+        previous, self._data, self.generation = self._data, data, generation
+        if previous is not None:
+            previous.close()
+            previous.unlink()
+        return generation
+
+    def close(self) -> None:
+        if self._data is not None:
+            self._data.close()
+            self._data.unlink()
+            self._data = None
+        self._control.close()
+        self._control.unlink()
+
+    def __enter__(self) -> "ConfigPublisher":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class ConfigReader(Mapping):
+    """Read-only mapping over the config a ConfigPublisher last published.
+
+    Lookups go to the generation attached at construction or at the last
+    refresh(), so a request handler sees one consistent version.
+
+    Raises:
+        FileNotFoundError: If no publisher has created the store, or it
+            hasn't published anything yet
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._control = _attach(name)
+        self._config: CompiledConfig | None = None
+        self.generation = 0
+        try:
+            if not self.refresh():
+                raise FileNotFoundError(f"nothing published to shared config {name!r} yet")
+        except BaseException:
+            self._control.close()
+            raise
+
+    def _published_generation(self) -> int:
+        magic, generation = _CONTROL.unpack_from(self._control.buf)
+        if magic != _CONTROL_MAGIC:
+            raise ValueError(f"not a shared config store: {self.name}")
+        return generation
+
+    def refresh(self) -> bool:
+        """Switch to the latest published generation, if it changed.
+
+        Returns:
+            True if a new generation was attached
+        """
+        for _ in range(_ATTACH_RETRIES):
+            generation = self._published_generation()
+            if generation == 0 or generation == self.generation:
+                return False
+            try:
+                segment = _attach(_segment_name(self.name, generation))
+            except FileNotFoundError:
+                # superseded while attaching, read the counter again
+                continue
+            config = CompiledConfig.from_buffer(segment.buf, segment, _segment_name(self.name, generation))
+            if self._config is not None:
+                self._config.close()
+            self._config, self.generation = config, generation
+            return True
+        raise RuntimeError(f"shared config {self.name!r} changed too often to attach")
+
+    @property
+    def stale(self) -> bool:
+        """True if a newer generation has been published since the last refresh."""
+        return self._published_generation() != self.generation
+
+    def __getitem__(self, key: str) -> Any:
+        return self._config[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._config
+
+    def __len__(self) -> int:
+        return len(self._config)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._config)
+
+    def close(self) -> None:
+        if self._config is not None:
+            self._config.close()
+            self._config = None
+        self._control.close()
+
+    def __enter__(self) -> "ConfigReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,63 @@
+from collections import Counter
+from typing import Callable
+
+# line categories besides the ValueType names of parsed entries
+BLANK = "BLANK"
+COMMENT = "COMMENT"
+INVALID = "INVALID"
+
+
+class ParseStats:
+    """Opt-in instrumentation for parse_config.
+
+    Pass an instance as parse_config(..., stats=ParseStats()) to collect
+    nanosecond timers for each phase (read, tokenize, classify, convert),
+    line counts by category and the number of bytes read. Counters add up
+    over every parse the same instance is passed to.
+
+    on_line(category, line_no) is called for every line and
+    on_finish(stats) once a file has been parsed. When no stats object is
+    given, the parser runs its uninstrumented loop and pays nothing.
+    """
+
+    __slots__ = ("read_ns", "tokenize_ns", "classify_ns", "convert_ns", "bytes_read",
+                 "files", "line_counts", "on_line", "on_finish")
+
+    def __init__(self, on_line: Callable[[str, int], None] | None = None,
+                 on_finish: Callable[["ParseStats"], None] | None = None):
+        self.on_line = on_line
+        self.on_finish = on_finish
+        self.reset()
+
+    def reset(self) -> None:
+        self.read_ns = 0
+        self.tokenize_ns = 0
+        self.classify_ns = 0
+        self.convert_ns = 0
+        self.bytes_read = 0
+        self.files = 0
+        self.line_counts: Counter[str] = Counter()
+
+    @property
+    def total_ns(self) -> int:
+        return self.read_ns + self.tokenize_ns + self.classify_ns + self.convert_ns
+
+    @property
+    def lines(self) -> int:
+        return sum(self.line_counts.values())
+
+    def as_dict(self) -> dict[str, int]:
+        """Flat name -> number mapping, ready for a metrics pipeline."""
+        metrics = {
+            "read_ns": self.read_ns,
+            "tokenize_ns": self.tokenize_ns,
+            "classify_ns": self.classify_ns,
+            "convert_ns": self.convert_ns,
+            "total_ns": self.total_ns,
+            "bytes_read": self.bytes_read,
+            "files": self.files,
+            "lines": self.lines,
+        }
+        for category, count in sorted(self.line_counts.items()):
+            metrics[f"lines_{category.lower()}"] = count
+        return metrics
@@ -0,0 +1,224 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+from config_cache import FileStamp, get_file_stamp
+from config_incremental import ConfigDiff, IncrementalConfigParser
+
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+# the directory is watched so editors that save by rename are still seen
+_WATCH_MASK = (_IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM
+               | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """One immutable, fully built version of a watched config file."""
+    config: Mapping[str, Any]
+    version: int
+    stamp: FileStamp
+
+
+Subscriber = Callable[[ConfigSnapshot, ConfigDiff], None]
+
+
+class _Inotify:
+    """Minimal ctypes binding, only the calls the watcher needs."""
+
+    def __init__(self, directory: str, file_name: str):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+        self.file_name = os.fsencode(file_name)
+
+    def read_matches(self) -> bool:
+        """Drain pending events, True if any concerned the watched file."""
+        matched = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return matched
+            offset = 0
+            while offset < len(data):
+                _, _, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b"\0")
+                offset += name_len
+                matched = matched or name == self.file_name
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class ConfigWatcher:
+    """Keep an always-ready snapshot of a config file for long-running services.
+
+    A background thread waits for changes, with inotify on Linux and mtime
+    polling elsewhere, debounces bursts of writes and re-parses the file
+    incrementally. Each reload publishes a new ConfigSnapshot by swapping a
+    single reference, so readers never block and never see a partial dict.
+    """
+
+    def __init__(self, file_path: str, debounce: float = 0.05,
+                 poll_interval: float = 1.0, use_inotify: bool = True):
+        self.file_path = os.path.realpath(file_path)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify and sys.platform.startswith("linux")
+        self.reloads = 0
+        self.failures = 0
+        self.last_reload_latency = 0.0
+        self.max_reload_latency = 0.0
+        self._total_reload_latency = 0.0
+        self._parser = IncrementalConfigParser(self.file_path)
+        self._snapshot: ConfigSnapshot | None = None
+        self._subscribers: list[Subscriber] = []
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._inotify: _Inotify | None = None
+        self._seen_stamp: FileStamp | None = None
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """The latest published snapshot, safe to read from any thread."""
+        if self._snapshot is None:
+            raise RuntimeError("watcher has not been started")
+        return self._snapshot
+
+    def subscribe(self, callback: Subscriber) -> None:
+        """Call callback(snapshot, diff) on the watcher thread after each reload."""
+        self._subscribers = self._subscribers + [callback]
+
+    def unsubscribe(self, callback: Subscriber) -> None:
+        self._subscribers = [subscriber for subscriber in self._subscribers
+                             if subscriber is not callback]
+
+    def start(self) -> "ConfigWatcher":
+        """Load the first snapshot and start watching for changes.
+
+        Raises:
+            FileNotFoundError: If the specified file doesn't exist
+        """
+        if self._thread is not None:
+            return self
+        self._publish(time.perf_counter())
+        if self.use_inotify:
+            try:
+                self._inotify = _Inotify(*os.path.split(self.file_path))
+            except (OSError, AttributeError, TypeError):
+                # no usable inotify here, fall back to polling
+                self._inotify = None
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="ConfigWatcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def __enter__(self) -> "ConfigWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "version": self._snapshot.version if self._snapshot else 0,
+            "inotify": self._inotify is not None,
+            "last_reload_latency": self.last_reload_latency,
+            "max_reload_latency": self.max_reload_latency,
+            "mean_reload_latency": self._total_reload_latency / self.reloads if self.reloads else 0.0,
+        }
+
+    def _read_stamp(self) -> FileStamp | None:
+        try:
+            return get_file_stamp(os.stat(self.file_path))
+        except FileNotFoundError:
+            return None
+
+    def _wait_for_change(self, timeout: float) -> bool:
+        if self._inotify is not None:
+            # wake up at least every poll_interval to notice stop()
+            ready, _, _ = select.select([self._inotify.fd], [], [], min(timeout, self.poll_interval))
+            return bool(ready) and self._inotify.read_matches()
+        if self._stopped.wait(timeout):
+            return False
+        stamp = self._read_stamp()
+        changed = stamp != self._seen_stamp
+        self._seen_stamp = stamp
+        return changed
+
+    def _run(self) -> None:
+        first_change = None
+        deadline = 0.0
+        while not self._stopped.is_set():
+            timeout = self.poll_interval if first_change is None else max(deadline - time.perf_counter(), 0.0)
+            if self._wait_for_change(timeout):
+                now = time.perf_counter()
+                first_change = first_change or now
+                # wait for the burst of writes to settle
+                deadline = now + self.debounce
+                continue
+            if first_change is not None and time.perf_counter() >= deadline:
+                if self._read_stamp() != self.snapshot.stamp:
+                    self._publish(first_change)
+                first_change = None
+
+    def _publish(self, changed_at: float) -> None:
+        try:
+            stamp = get_file_stamp(os.stat(self.file_path))
+            diff = self._parser.load()
+        except (OSError, ValueError) as error:
+            if self._snapshot is None:
+                raise
+            # keep serving the previous snapshot until the file is back
+            self.failures += 1
+            logging.warning(f"config reload failed for {self.file_path}: {error}")
+            return
+        self._seen_stamp = stamp
+        version = self._snapshot.version + 1 if self._snapshot else 1
+        snapshot = ConfigSnapshot(MappingProxyType(dict(self._parser.config)), version, stamp)
+        # a single reference assignment is the atomic swap readers rely on
+        self._snapshot = snapshot
+        if version > 1:
+            latency = time.perf_counter() - changed_at
+            self.reloads += 1
+            self.last_reload_latency = latency
+            self.max_reload_latency = max(self.max_reload_latency, latency)
+            self._total_reload_latency += latency
+        for subscriber in self._subscribers:
+            try:
+                subscriber(snapshot, diff)
+            except Exception:
+                logging.exception("config watcher subscriber failed")
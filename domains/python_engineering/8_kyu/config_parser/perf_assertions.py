@@ -0,0 +1,147 @@
+"""
+Performance assertions for hidden tests.
+
+Times a submitted implementation against reference implementations (the
+model solutions) on the same input and grades it relative to the best
+reference, so a challenge can require "no more than 2x slower and 2x the
+memory of the best model solution" without hard-coding machine-specific
+numbers.
+
+    class TestPerformance(PerformanceAssertions, unittest.TestCase):
+        def test_parse_speed(self):
+            self.assertWithinBudget(parse_config, REFERENCES, path,
+                                    budget=Budget(time_ratio=2.0))
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable
+import gc
+import time
+import tracemalloc
+
+
+class Grade(str, Enum):
+    # at least as good as the best reference on both time and memory
+    EXCELLENT = "EXCELLENT"
+    PASS = "PASS"
+    FAIL = "FAIL"
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Allowed cost as a multiple of the best reference."""
+    time_ratio: float = 2.0
+    memory_ratio: float = 2.0
+
+
+@dataclass(frozen=True)
+class Measurement:
+    # best wall time of the timed repeats
+    seconds: float
+    # peak traced allocation during one extra, untimed run
+    peak_bytes: int
+
+
+@dataclass(frozen=True)
+class PerformanceResult:
+    candidate: Measurement
+    references: dict[str, Measurement]
+    time_ratio: float
+    memory_ratio: float
+    grade: Grade
+
+    def describe(self) -> str:
+        fastest = min(self.references, key=lambda name: self.references[name].seconds)
+        leanest = min(self.references, key=lambda name: self.references[name].peak_bytes)
+        return (f"{self.grade.value}: {self.candidate.seconds * 1000:.1f} ms "
+                f"({self.time_ratio:.2f}x {fastest}), "
+                f"{self.candidate.peak_bytes / 1024:,.0f} KiB peak "
+                f"({self.memory_ratio:.2f}x {leanest})")
+
+
+def measure(func: Callable[..., Any], *args: Any, repeats: int = 5, warmup: int = 1) -> Measurement:
+    """Time func(*args) and trace its peak memory.
+
+    Warm-up calls fill the page cache and any lazily built state first.
+    The best of repeats is kept, since slower runs only add scheduler and
+    cache noise. Memory is traced in a separate call because tracemalloc
+    slows allocation down and would skew the timings.
+    """
+    return measure_interleaved([func], *args, repeats=repeats, warmup=warmup)[0]
+
+
+def measure_interleaved(funcs: list[Callable[..., Any]], *args: Any, repeats: int = 5,
+                        warmup: int = 1) -> list[Measurement]:
+    """Measure several functions on the same args, as measure does.
+
+    Each repeat times every function once, in turn, so a change in machine
+    load during the measurement slows all of them alike instead of skewing
+    their ratio.
+    """
+    for _ in range(warmup):
+        for func in funcs:
+            func(*args)
+    seconds = [float("inf")] * len(funcs)
+    for _ in range(repeats):
+        for index, func in enumerate(funcs):
+            gc.collect()
+            start = time.perf_counter()
+            func(*args)
+            seconds[index] = min(seconds[index], time.perf_counter() - start)
+    peaks = []
+    for func in funcs:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peaks.append(peak)
+    return [Measurement(*measurement) for measurement in zip(seconds, peaks)]
+
+
+def grade_performance(candidate: Callable[..., Any], references: dict[str, Callable[..., Any]],
+                      *args: Any, budget: Budget = Budget(), repeats: int = 5,
+                      warmup: int = 1) -> PerformanceResult:
+    """Measure candidate and every reference on args and grade the candidate.
+
+    Time is compared with the fastest reference and memory with the
+    leanest one, which need not be the same implementation. The candidate
+    and references are timed in turn, see measure_interleaved.
+
+    Raises:
+        ValueError: If no references are given
+    """
+    if not references:
+        raise ValueError("at least one reference implementation is required")
+    *reference_results, result = measure_interleaved([*references.values(), candidate], *args,
+                                                      repeats=repeats, warmup=warmup)
+    measured = dict(zip(references, reference_results))
+    best_seconds = min(m.seconds for m in measured.values())
+    best_peak = min(m.peak_bytes for m in measured.values())
+    time_ratio = result.seconds / best_seconds if best_seconds else 1.0
+    memory_ratio = result.peak_bytes / best_peak if best_peak else 1.0
+    if time_ratio <= 1.0 and memory_ratio <= 1.0:
+        grade = Grade.EXCELLENT
+    elif time_ratio <= budget.time_ratio and memory_ratio <= budget.memory_ratio:
+        grade = Grade.PASS
+    else:
+        grade = Grade.FAIL
+    return PerformanceResult(result, measured, time_ratio, memory_ratio, grade)
+
+
+class PerformanceAssertions:
+    """unittest.TestCase mixin adding assertWithinBudget."""
+
+    def assertWithinBudget(self, candidate: Callable[..., Any],
+                           references: dict[str, Callable[..., Any]], *args: Any,
+                           budget: Budget = Budget(), repeats: int = 5,
+                           warmup: int = 1) -> PerformanceResult:
+        result = grade_performance(candidate, references, *args, budget=budget,
+                                   repeats=repeats, warmup=warmup)
+        if result.grade == Grade.FAIL:
+            self.fail(f"over budget ({budget.time_ratio}x time, {budget.memory_ratio}x memory): "
+                      + result.describe())
+        return result
@@ -0,0 +1,36 @@
+import os
+import tempfile
+import unittest
+from config_parser import parse_config, iter_config
+from config_async import parse_config_async, parse_configs_async, aiter_config
+
+class TestAsyncConfigParser(unittest.IsolatedAsyncioTestCase):
+    
+    def setUp(self):
+        self.temp_file = tempfile.NamedTemporaryFile('w', delete=False)
+        self.temp_file.write("name = api\nport = 8080\nratio = 0.5\n")
+        self.temp_file.close()
+    
+    def tearDown(self):
+        os.unlink(self.temp_file.name)
+    
+    async def test_matches_parse_config(self):
+        config = await parse_config_async(self.temp_file.name)
+        self.assertEqual(config, parse_config(self.temp_file.name))
+    
+    async def test_batch_captures_failures(self):
+        results = await parse_configs_async([self.temp_file.name, "non_existent_file.conf"], limit=1)
+        self.assertEqual(results[self.temp_file.name]['port'], 8080)
+        self.assertIsInstance(results["non_existent_file.conf"], FileNotFoundError)
+    
+    async def test_async_iterator(self):
+        entries = [entry async for entry in aiter_config(self.temp_file.name, batch_size=2)]
+        self.assertEqual(entries, list(iter_config(self.temp_file.name)))
+    
+    async def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            await parse_config_async("non_existent_file.conf")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+from config_batch import parse_configs, iter_parse_configs
+
+class TestParseConfigs(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for index in range(5):
+            path = os.path.join(self.temp_dir.name, f"tenant_{index}.conf")
+            with open(path, 'w') as f:
+                f.write(f"tenant = {index}\n")
+            self.paths.append(path)
+        self.missing = os.path.join(self.temp_dir.name, "missing.conf")
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_failures_are_captured(self):
+        for executor in ("thread", "process"):
+            results = parse_configs(self.paths + [self.missing], workers=2, executor=executor)
+            self.assertEqual(list(results), self.paths + [self.missing])
+            for index, path in enumerate(self.paths):
+                self.assertEqual(results[path], {"tenant": index})
+            self.assertIsInstance(results[self.missing], FileNotFoundError)
+    
+    def test_streams_results(self):
+        streamed = dict(iter_parse_configs(self.paths, workers=2))
+        self.assertEqual(streamed, parse_configs(self.paths))
+    
+    def test_unknown_executor(self):
+        with self.assertRaises(ValueError):
+            parse_configs(self.paths, executor="fiber")
+
+
+if __name__ == '__main__':
+    unittest.main()
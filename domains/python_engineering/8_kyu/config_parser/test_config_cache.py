@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+from config_cache import CachedConfigLoader
+
+class TestCachedConfigLoader(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def write_config(self, name, text):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+    
+    def test_hit_until_file_changes(self):
+        path = self.write_config("app.conf", "port = 80\n")
+        loader = CachedConfigLoader()
+        first = loader.load(path)
+        self.assertIs(loader.load(path), first)
+        self.assertEqual(first['port'], 80)
+        with self.assertRaises(TypeError):
+            first['port'] = 81
+        
+        self.write_config("app.conf", "port = 8080\n")
+        self.assertEqual(loader.load(path)['port'], 8080)
+        self.assertEqual(loader.stats(), {"hits": 1, "misses": 2, "evictions": 0, "entries": 1})
+    
+    def test_lru_eviction(self):
+        paths = [self.write_config(f"{name}.conf", f"name = {name}\n") for name in "abc"]
+        loader = CachedConfigLoader(max_entries=2)
+        loader.load(paths[0])
+        loader.load(paths[1])
+        loader.load(paths[0])
+        loader.load(paths[2])
+        self.assertEqual(loader.evictions, 1)
+        # b was least recently used, a is still cached
+        loader.load(paths[0])
+        self.assertEqual(loader.hits, 2)
+    
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            CachedConfigLoader().load("non_existent_file.conf")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+from config_parser import parse_config
+from config_compiled import CompiledConfig, compile_config, load_compiled_config
+
+class TestCompiledConfig(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self.temp_dir.name, "app.conf")
+        self.dst = os.path.join(self.temp_dir.name, "app.snap")
+        with open(self.src, 'w') as f:
+            f.write("name = \"My App\"\nport = 8080\nhuge = 123456789012345678901234567890\n")
+            f.write("ratio = -0.25\ndebug = FALSE\nport = 9090\n")
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_round_trip_preserves_types_and_order(self):
+        compile_config(self.src, self.dst)
+        expected = parse_config(self.src)
+        with CompiledConfig(self.dst) as compiled:
+            self.assertEqual(list(compiled.items()), list(expected.items()))
+            for key, value in expected.items():
+                self.assertIs(type(compiled[key]), type(value))
+            self.assertNotIn("missing", compiled)
+            with self.assertRaises(KeyError):
+                compiled["missing"]
+    
+    def test_rebuilds_when_source_changes(self):
+        with load_compiled_config(self.src, self.dst) as compiled:
+            self.assertEqual(compiled["port"], 9090)
+        with open(self.src, 'a') as f:
+            f.write("port = 1\n")
+        with load_compiled_config(self.src, self.dst) as compiled:
+            self.assertEqual(compiled["port"], 1)
+    
+    def test_rejects_foreign_files(self):
+        with self.assertRaises(ValueError):
+            CompiledConfig(self.src)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+import logging
+from config_parser import iter_config, parse_config
+from config_diagnostics import Diagnostics, DiagnosticRecord, Reason
+
+class TestDiagnostics(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_file = tempfile.NamedTemporaryFile('w', delete=False, newline='')
+        self.temp_file.write("ok = 1\r\nfirst bad\n# comment\r  second bad\nok = 2\nthird bad")
+        self.temp_file.close()
+        self.messages = []
+    
+    def tearDown(self):
+        os.unlink(self.temp_file.name)
+    
+    def test_records_with_offsets(self):
+        expected = [
+            DiagnosticRecord(2, 8, Reason.MISSING_SEPARATOR),
+            DiagnosticRecord(4, 28, Reason.MISSING_SEPARATOR),
+            DiagnosticRecord(6, 48, Reason.MISSING_SEPARATOR),
+        ]
+        for engine in ("text", "mmap"):
+            diagnostics = Diagnostics(sink=self.messages.append)
+            config = parse_config(self.temp_file.name, engine, diagnostics=diagnostics)
+            self.assertEqual(config, {"ok": 2})
+            self.assertEqual(diagnostics.records(), expected)
+        # one summary per parse
+        self.assertEqual(len(self.messages), 2)
+        self.assertIn("line 4 (missing '='): second bad", self.messages[0])
+    
+    def test_sampling_and_capacity(self):
+        diagnostics = Diagnostics(capacity=1, sample_every=2, sink=None)
+        for line_no in range(1, 6):
+            diagnostics.record(Reason.INVALID_VALUE, line_no, 0)
+        self.assertEqual(diagnostics.total, 5)
+        self.assertEqual(diagnostics.dropped, 4)
+        self.assertEqual([record.line_no for record in diagnostics.records()], [1])
+    
+    def test_pipe_source(self):
+        # summaries come from what the parse recorded, never from reading the path again
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(write_fd, 'w') as writer:
+            writer.write("a = 1\nnot valid\n")
+        try:
+            with self.assertLogs(level=logging.WARNING) as logs:
+                config = parse_config(f"/dev/fd/{read_fd}")
+        finally:
+            os.close(read_fd)
+        self.assertEqual(config, {'a': 1})
+        self.assertIn("line 2 (missing '='): not valid", logs.output[0])
+    
+    def test_summary_after_file_replaced(self):
+        messages = []
+        diagnostics = Diagnostics(sink=messages.append)
+        entries = iter_config(self.temp_file.name, diagnostics=diagnostics)
+        next(entries)
+        with open(self.temp_file.name, 'w') as f:
+            f.write("")
+        list(entries)
+        self.assertEqual(diagnostics.total, 3)
+        self.assertIn("line 2 (missing '='): first bad", messages[0])
+    
+    def test_silent_sink(self):
+        diagnostics = Diagnostics(sink=None)
+        with self.assertNoLogs(level=logging.WARNING):
+            parse_config(self.temp_file.name, diagnostics=diagnostics)
+        self.assertEqual(diagnostics.total, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
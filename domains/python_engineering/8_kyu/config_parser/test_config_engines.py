@@ -0,0 +1,141 @@
+import os
+import tempfile
+import unittest
+import logging
+import tracemalloc
+from io import StringIO
+from config_parser import parse_config, iter_config, MIN_PARALLEL_BYTES, _parse_chunk
+from perf_assertions import Budget, Grade, grade_performance
+import bench_parsers
+
+class TestConfigEngines(unittest.TestCase):
+    
+    def setUp(self):
+        # Create a temporary file for testing
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False)
+        self.temp_file.close()
+        
+        # Set up logging capture
+        self.log_capture = StringIO()
+        self.log_handler = logging.StreamHandler(self.log_capture)
+        logging.getLogger().addHandler(self.log_handler)
+        logging.getLogger().setLevel(logging.WARNING)
+    
+    def tearDown(self):
+        # Clean up temporary file
+        if os.path.exists(self.temp_file.name):
+            os.unlink(self.temp_file.name)
+            
+        # Clean up logging
+        logging.getLogger().removeHandler(self.log_handler)
+    
+    def test_iter_config_streams_entries(self):
+        # Test streaming entries with their line numbers
+        with open(self.temp_file.name, 'w') as f:
+            f.write("# header\n")
+            f.write("port = 8080\n")
+            f.write("\n")
+            f.write("invalid line\n")
+            f.write("port = 9090\n")
+        
+        entries = iter_config(self.temp_file.name)
+        self.assertEqual(next(entries), ("port", 8080, 2))
+        self.assertEqual(list(entries), [("port", 9090, 5)])
+        # parse_config keeps the last duplicate
+        self.assertEqual(parse_config(self.temp_file.name), {"port": 9090})
+    
+    def test_mmap_engine_matches_text_engine(self):
+        # Test that the mmap engine returns exactly the same dict
+        with open(self.temp_file.name, 'w', newline='') as f:
+            f.write("# comment\r\n")
+            f.write("  name =  \"quoted value\"  \r\n")
+            f.write("count = -12\n")
+            f.write("ratio = .5\n")
+            f.write("flag = FALSE\n")
+            f.write("city = Zürich\n")
+            f.write("\u2003# indented comment\n")
+            f.write("broken line\n")
+            f.write("count = 13")
+        
+        expected = parse_config(self.temp_file.name)
+        config = parse_config(self.temp_file.name, engine="mmap")
+        self.assertEqual(config, expected)
+        self.assertEqual([type(v) for v in config.values()],
+                         [type(v) for v in expected.values()])
+        self.assertEqual(config['count'], 13)
+    
+    def test_mmap_engine_empty_file(self):
+        # Test that an empty file can't trip up mmap
+        config = parse_config(self.temp_file.name, engine="mmap")
+        self.assertEqual(config, {})
+    
+    def test_parallel_chunks_match_sequential_parse(self):
+        # Test that chunked parsing keeps order, last-write-wins and line numbers
+        with open(self.temp_file.name, 'w', newline='') as f:
+            line_no = 0
+            while f.tell() < MIN_PARALLEL_BYTES * 2:
+                line_no += 1
+                if line_no % 1000 == 0:
+                    f.write("broken line\r\n")
+                else:
+                    f.write(f"key{line_no % 500} = {line_no}\n")
+        
+        sequential = parse_config(self.temp_file.name)
+        sequential_log = self.log_capture.getvalue()
+        self.log_capture.truncate(0)
+        self.log_capture.seek(0)
+        parallel = parse_config(self.temp_file.name, workers=3)
+        
+        self.assertEqual(list(parallel.items()), list(sequential.items()))
+        self.assertEqual(self.log_capture.getvalue(), sequential_log)
+        self.assertIn("line 1000 (missing '='): broken line", sequential_log)
+    
+    def test_parallel_chunk_streams_lines(self):
+        # a worker holds a buffer and a line of its range, never all of it
+        with open(self.temp_file.name, 'w') as f:
+            f.writelines(f"# comment {index:>100}\n" for index in range(20_000))
+            f.write("key = 1\n")
+        size = os.path.getsize(self.temp_file.name)
+        
+        tracemalloc.start()
+        try:
+            chunk_dict, line_count, *_ = _parse_chunk(self.temp_file.name, 0, size, 5)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual((chunk_dict, line_count), ({"key": 1}, 20_001))
+        self.assertLess(peak, size // 10)
+    
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            parse_config(self.temp_file.name, engine="turbo")
+
+
+class TestEnginePerformance(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        logging.disable(logging.WARNING)
+    
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        self.temp_dir.cleanup()
+    
+    def test_mmap_faster_than_text(self):
+        # the mmap engine only exists to be faster, on every benchmark mix;
+        # with no slack in the budget, a noisy run gets measured again
+        budget = Budget(time_ratio=1.0, memory_ratio=1.5)
+        for mix in bench_parsers.MIXES:
+            path = os.path.join(self.temp_dir.name, f"{mix}.conf")
+            bench_parsers.write_config(path, 15_000, mix)
+            with self.subTest(mix=mix):
+                for _ in range(3):
+                    result = grade_performance(lambda path: parse_config(path, "mmap"),
+                                               {"text": parse_config}, path, budget=budget, repeats=9)
+                    if result.grade != Grade.FAIL:
+                        break
+                self.assertNotEqual(result.grade, Grade.FAIL, result.describe())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+from config_parser import parse_config
+from config_incremental import IncrementalConfigParser
+
+class TestIncrementalConfigParser(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False)
+        self.temp_file.close()
+    
+    def tearDown(self):
+        os.unlink(self.temp_file.name)
+    
+    def write_lines(self, lines):
+        with open(self.temp_file.name, 'w') as f:
+            f.write("\n".join(lines) + "\n")
+    
+    def test_reparses_only_edited_lines(self):
+        lines = [f"key{i} = {i}" for i in range(100)]
+        self.write_lines(lines)
+        parser = IncrementalConfigParser(self.temp_file.name)
+        self.assertEqual(len(parser.load().added), 100)
+        
+        lines[50] = "key50 = changed"
+        lines.insert(10, "extra = true")
+        del lines[80]
+        self.write_lines(lines)
+        diff = parser.load()
+        self.assertEqual(diff.added, {"extra": True})
+        self.assertEqual(diff.changed, {"key50": (50, "changed")})
+        self.assertEqual(diff.removed, {"key79": 79})
+        self.assertEqual(parser.lines_reparsed, 70)
+        self.assertEqual(parser.config, parse_config(self.temp_file.name))
+        
+        self.assertFalse(parser.load())
+        self.assertEqual(parser.lines_reparsed, 0)
+    
+    def test_duplicate_keys_last_write_wins(self):
+        self.write_lines(["port = 1", "host = a", "port = 2"])
+        parser = IncrementalConfigParser(self.temp_file.name)
+        parser.load()
+        
+        # editing the shadowed occurrence changes nothing
+        self.write_lines(["port = 10", "host = a", "port = 2"])
+        self.assertFalse(parser.load())
+        
+        # dropping the winner exposes the earlier occurrence
+        self.write_lines(["port = 10", "host = a"])
+        self.assertEqual(parser.load().changed, {"port": (2, 10)})
+        self.assertEqual(parser.config, {"port": 10, "host": "a"})
+    
+    def test_key_order_matches_parse_config(self):
+        lines = [f"key{i} = {i}" for i in range(50, 0, -1)]
+        self.write_lines(lines)
+        parser = IncrementalConfigParser(self.temp_file.name)
+        self.assertEqual(list(parser.load().added), list(parse_config(self.temp_file.name)))
+        self.assertEqual(list(parser.config), list(parse_config(self.temp_file.name)))
+        
+        # a new key above the others, and an earlier first occurrence of key1
+        lines[10:10] = ["first = 1", "key1 = 0"]
+        lines.insert(0, "top = 1")
+        self.write_lines(lines)
+        parser.load()
+        self.assertEqual(list(parser.config.items()), list(parse_config(self.temp_file.name).items()))
+
+    
+    def test_key_order_after_first_occurrence_removed(self):
+        with open(self.temp_file.name, 'w') as f:
+            f.write("\nc = x\nb = 2\nc = x")
+        parser = IncrementalConfigParser(self.temp_file.name)
+        parser.load()
+        with open(self.temp_file.name, 'w') as f:
+            f.write("b = 2\nc = x")
+        parser.load()
+        self.assertEqual(list(parser.config.items()), list(parse_config(self.temp_file.name).items()))
+
+
+if __name__ == '__main__':
+    unittest.main()
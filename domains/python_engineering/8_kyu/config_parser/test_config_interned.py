@@ -0,0 +1,57 @@
+import tracemalloc
+import unittest
+from config_parser import loads
+from config_interned import InterningLoader, SharedConfig
+
+class TestInterningLoader(unittest.TestCase):
+    
+    def make_tenant(self, tenant):
+        return (f"theme = dark\nfeature_x = enabled\nport = 8080\n"
+                f"host = db{tenant % 3}.example.com\nname = tenant {tenant}\n").encode()
+    
+    def test_equal_to_plain_parse(self):
+        loader = InterningLoader()
+        data = self.make_tenant(1)
+        config = loader.loads(data)
+        self.assertIsInstance(config, SharedConfig)
+        self.assertEqual(config, loads(data))
+        self.assertEqual(list(config), list(loads(data)))
+        self.assertNotIn("missing", config)
+        with self.assertRaises(KeyError):
+            config["missing"]
+    
+    def test_objects_are_shared(self):
+        loader = InterningLoader()
+        first, second = loader.loads(self.make_tenant(1)), loader.loads(self.make_tenant(4))
+        self.assertIs(first._shape, second._shape)
+        self.assertIs(first["theme"], second["theme"])
+        self.assertIs(first["host"], second["host"])
+        self.assertIs(first["port"], second["port"])
+        self.assertIsNot(first["name"], second["name"])
+        usage = loader.memory_usage([first, second])
+        self.assertEqual(usage["shapes"], 1)
+        self.assertEqual(usage["configs"], 2)
+    
+    def test_types_not_merged(self):
+        loader = InterningLoader()
+        config = loader.intern({"a": 1, "b": True, "c": 1.0, "d": "1"})
+        self.assertEqual([type(value) for value in config.values()], [int, bool, float, str])
+    
+    def test_smaller_than_dicts(self):
+        tenants = [self.make_tenant(tenant) for tenant in range(500)]
+        tracemalloc.start()
+        plain = [loads(data) for data in tenants]
+        plain_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del plain
+        loader = InterningLoader()
+        tracemalloc.start()
+        shared = [loader.loads(data) for data in tenants]
+        shared_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        self.assertEqual(len(shared), 500)
+        self.assertLess(shared_bytes * 2, plain_bytes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import tracemalloc
+import unittest
+from config_parser import parse_config
+from config_lazy import ConfigView, parse_config_lazy
+import bench_parsers
+
+class TestConfigView(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_file = tempfile.NamedTemporaryFile('w', delete=False)
+        self.temp_file.write("name = 'svc'\nport = 80\n# comment\nratio = 2.5\nport = 443\nflag = True\n")
+        self.temp_file.close()
+    
+    def tearDown(self):
+        os.unlink(self.temp_file.name)
+    
+    def test_matches_parse_config(self):
+        with parse_config_lazy(self.temp_file.name) as view:
+            expected = parse_config(self.temp_file.name)
+            self.assertEqual(list(view), list(expected))
+            self.assertEqual(dict(view), expected)
+            self.assertIs(type(view['ratio']), float)
+    
+    def test_values_convert_on_first_access(self):
+        with parse_config_lazy(self.temp_file.name) as view:
+            self.assertEqual(len(view), 4)
+            self.assertIn('port', view)
+            self.assertEqual(view['port'], 443)
+            self.assertIs(view['name'], view['name'])
+            with self.assertRaises(KeyError):
+                view['missing']
+    
+    def test_has_no_instance_dict(self):
+        self.assertFalse(hasattr(ConfigView(b"", "utf-8"), "__dict__"))
+    
+    def test_smaller_than_parsed_dict(self):
+        # before any value is read the view holds less than the dict it replaces
+        for mix in ("clean", "numeric"):
+            bench_parsers.write_config(self.temp_file.name, 50_000, mix)
+            with self.subTest(mix=mix):
+                sizes = []
+                for parse in (parse_config, parse_config_lazy):
+                    tracemalloc.start()
+                    try:
+                        config = parse(self.temp_file.name)
+                        sizes.append(tracemalloc.get_traced_memory()[0])
+                    finally:
+                        tracemalloc.stop()
+                    del config
+                dict_size, view_size = sizes
+                self.assertLess(view_size, dict_size)
+
+
+if __name__ == '__main__':
+    unittest.main()
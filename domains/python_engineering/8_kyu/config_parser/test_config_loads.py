@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+from io import BytesIO, StringIO
+from config_parser import parse_config, load, loads
+from config_diagnostics import Diagnostics
+
+class TestLoads(unittest.TestCase):
+    
+    TEXT = "# comment\r\nname = test\rport=80\nbroken\nratio = 0.5\nname = 'last'\n"
+    EXPECTED = {"name": "last", "port": 80, "ratio": 0.5}
+    
+    def test_all_input_types(self):
+        data = self.TEXT.encode()
+        for source in (self.TEXT, data, bytearray(data), memoryview(data)):
+            with self.subTest(source=type(source).__name__):
+                self.assertEqual(loads(source, diagnostics=Diagnostics(sink=None)), self.EXPECTED)
+        self.assertEqual(load(StringIO(self.TEXT), diagnostics=Diagnostics(sink=None)), self.EXPECTED)
+        self.assertEqual(load(BytesIO(data), diagnostics=Diagnostics(sink=None)), self.EXPECTED)
+    
+    def test_matches_parse_config(self):
+        text = "a = 1\nb = true\nno separator\n c = \"quoted\" \nd = -.5"
+        with tempfile.NamedTemporaryFile('w', delete=False) as f:
+            f.write(text)
+        try:
+            self.assertEqual(loads(text.encode(), diagnostics=Diagnostics(sink=None)),
+                             parse_config(f.name, diagnostics=Diagnostics(sink=None)))
+        finally:
+            os.unlink(f.name)
+    
+    def test_slice_of_larger_buffer(self):
+        data = b"skipped = 1\nkept = 2\nalso = yes\n"
+        self.assertEqual(loads(memoryview(data)[12:21]), {"kept": 2})
+    
+    def test_summary_quotes_buffer(self):
+        messages = []
+        loads(b"a = 1\r\nbroken\n", diagnostics=Diagnostics(sink=messages.append))
+        self.assertEqual(len(messages), 1)
+        self.assertIn("<string>", messages[0])
+        self.assertIn("line 2 (missing '='): broken", messages[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
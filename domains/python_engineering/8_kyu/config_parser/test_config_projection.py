@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from config_parser import parse_config
+from config_diagnostics import Diagnostics
+from config_stats import ParseStats
+
+class TestKeyProjection(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_file = tempfile.NamedTemporaryFile('w', delete=False, newline='')
+        self.temp_file.write("port = 80\nname = first\r\n# port = 1\nbroken\n"
+                             "debug = true\rname = 'last'\nratio=0.5\n\n")
+        self.temp_file.close()
+    
+    def tearDown(self):
+        os.unlink(self.temp_file.name)
+    
+    def test_matches_full_parse(self):
+        full = parse_config(self.temp_file.name, diagnostics=Diagnostics(sink=None))
+        keys = ["name", "port", "debug", "missing"]
+        projected = parse_config(self.temp_file.name, keys=keys)
+        self.assertEqual(projected, {"name": "last", "port": 80, "debug": True})
+        self.assertEqual(projected, {key: full[key] for key in keys if key in full})
+        self.assertEqual(list(projected), ["name", "port", "debug"])
+    
+    def test_stops_early(self):
+        with open(self.temp_file.name, 'wb') as f:
+            # undecodable bytes before the last write of every key are never read
+            f.write(b"\xff\xfe = \xff\n" + b"filler = 1\n" * 1000 + b"a = 1\nb = two\n")
+        self.assertEqual(parse_config(self.temp_file.name, keys=["b", "a"]), {"b": "two", "a": 1})
+    
+    def test_empty_file_and_stats(self):
+        with open(self.temp_file.name, 'w'):
+            pass
+        self.assertEqual(parse_config(self.temp_file.name, keys=["a"]), {})
+        with self.assertRaises(ValueError):
+            parse_config(self.temp_file.name, keys=["a"], stats=ParseStats())
+    
+    def test_rejects_bare_str(self):
+        with self.assertRaises(TypeError):
+            parse_config(self.temp_file.name, keys="port")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from config_parser import loads
+from config_schema import SchemaError, compile_schema
+
+class TestCompiledSchema(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_file = tempfile.NamedTemporaryFile('w', delete=False)
+        self.temp_file.write("# port = 1\nport = 80\nversion = 1.10\nignored = whatever\n"
+                             "  debug=TRUE\rname = 'svc'\nport = 8080\nnot a key line\n")
+        self.temp_file.close()
+        self.schema = compile_schema({"port": int, "version": str, "debug": bool, "name": str})
+    
+    def tearDown(self):
+        os.unlink(self.temp_file.name)
+    
+    def test_declared_types(self):
+        config = self.schema.parse(self.temp_file.name)
+        self.assertEqual(config, {"port": 8080, "version": "1.10", "debug": True, "name": "svc"})
+        self.assertEqual(list(config), ["port", "version", "debug", "name"])
+        with open(self.temp_file.name, "rb") as f:
+            self.assertEqual(self.schema.loads(f.read()), config)
+    
+    def test_validation_errors(self):
+        schema = compile_schema({"port": int, "timeout": float, "debug": bool})
+        with self.assertRaises(SchemaError) as context:
+            schema.loads("port = eighty\ndebug = yes\n")
+        errors = context.exception.errors
+        self.assertEqual(len(errors), 3)
+        self.assertIn("line 1: port", errors[0])
+        self.assertIn("line 2: debug", errors[1])
+        self.assertIn("missing required key 'timeout'", errors[2])
+    
+    def test_defaults_and_custom_converters(self):
+        schema = compile_schema({"hosts": lambda token: token.split(","), "retries": int},
+                                defaults={"retries": 3})
+        self.assertEqual(schema.loads("hosts = a,b\n"), {"hosts": ["a", "b"], "retries": 3})
+        with self.assertRaises(ValueError):
+            compile_schema({"port": int}, defaults={"other": 1})
+        with self.assertRaises(ValueError):
+            compile_schema({"a=b": int})
+        with self.assertRaises(ValueError):
+            compile_schema({"#x": int})
+    
+    def test_str_unquoting_matches_parse_config(self):
+        schema = compile_schema({"a": str, "b": str, "c": str})
+        data = "a = \"a\"b\"\nb = 'it's'\nc = \"quoted\"\n"
+        self.assertEqual(schema.loads(data), loads(data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from config_parser import parse_config
+from config_shared import ConfigPublisher, ConfigReader
+
+def _read_shared_config(name, queue):
+    with ConfigReader(name) as reader:
+        queue.put((reader.generation, dict(reader)))
+
+
+class TestSharedConfig(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_file = tempfile.NamedTemporaryFile('w', delete=False)
+        self.temp_file.write("name = test\nport = 80\nratio = 0.5\ndebug = true\n")
+        self.temp_file.close()
+        self.name = f"cfg_test_{os.getpid()}"
+    
+    def tearDown(self):
+        os.unlink(self.temp_file.name)
+    
+    def test_publish_and_refresh(self):
+        with ConfigPublisher(self.name, self.temp_file.name) as publisher:
+            with self.assertRaises(FileNotFoundError):
+                ConfigReader(self.name)
+            self.assertEqual(publisher.publish(), 1)
+            with ConfigReader(self.name) as reader:
+                self.assertEqual(dict(reader), parse_config(self.temp_file.name))
+                self.assertFalse(reader.stale)
+                with open(self.temp_file.name, 'a') as f:
+                    f.write("port = 8080\n")
+                publisher.publish()
+                # the attached generation stays consistent until refresh
+                self.assertTrue(reader.stale)
+                self.assertEqual(reader["port"], 80)
+                self.assertTrue(reader.refresh())
+                self.assertEqual(reader.generation, 2)
+                self.assertEqual(reader["port"], 8080)
+                self.assertFalse(reader.refresh())
+        with self.assertRaises(FileNotFoundError):
+            ConfigReader(self.name)
+    
+    def test_reader_in_other_process(self):
+        with ConfigPublisher(self.name, self.temp_file.name) as publisher:
+            publisher.publish()
+            queue = multiprocessing.Queue()
+            process = multiprocessing.Process(target=_read_shared_config, args=(self.name, queue))
+            process.start()
+            generation, config = queue.get(timeout=10)
+            process.join()
+            self.assertEqual(generation, 1)
+            self.assertEqual(config, parse_config(self.temp_file.name))
+            # the reader exiting must not take the segment with it
+            with ConfigReader(self.name) as reader:
+                self.assertEqual(dict(reader), config)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from config_parser import parse_config
+from config_diagnostics import Diagnostics
+from config_stats import ParseStats
+
+class TestParseStats(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_file = tempfile.NamedTemporaryFile('w', delete=False)
+        self.temp_file.write("# comment\n\nname = test\nport = 80\nratio = 0.5\n"
+                             "debug = true\nbroken line\nquoted = \"x\"\n")
+        self.temp_file.close()
+    
+    def tearDown(self):
+        os.unlink(self.temp_file.name)
+    
+    def test_counts_and_timers(self):
+        lines = []
+        finished = []
+        stats = ParseStats(on_line=lambda category, line_no: lines.append((category, line_no)),
+                           on_finish=finished.append)
+        config = parse_config(self.temp_file.name, diagnostics=Diagnostics(sink=None), stats=stats)
+        self.assertEqual(config, parse_config(self.temp_file.name, diagnostics=Diagnostics(sink=None)))
+        self.assertEqual(dict(stats.line_counts), {
+            "COMMENT": 1, "BLANK": 1, "STRING": 1, "INT": 1,
+            "FLOAT": 1, "BOOL": 1, "INVALID": 1, "DOUBLE_QUOTE": 1,
+        })
+        self.assertEqual(lines[6], ("INVALID", 7))
+        self.assertEqual(finished, [stats])
+        self.assertEqual(stats.bytes_read, os.path.getsize(self.temp_file.name))
+        self.assertGreater(stats.total_ns, 0)
+        metrics = stats.as_dict()
+        self.assertEqual(metrics["lines"], 8)
+        self.assertEqual(metrics["lines_int"], 1)
+        self.assertEqual(metrics["files"], 1)
+    
+    def test_accumulates_and_resets(self):
+        stats = ParseStats()
+        parse_config(self.temp_file.name, diagnostics=Diagnostics(sink=None), stats=stats)
+        parse_config(self.temp_file.name, diagnostics=Diagnostics(sink=None), stats=stats)
+        self.assertEqual(stats.files, 2)
+        self.assertEqual(stats.lines, 16)
+        stats.reset()
+        self.assertEqual(stats.as_dict()["lines"], 0)
+    
+    def test_text_engine_only(self):
+        with self.assertRaises(ValueError):
+            parse_config(self.temp_file.name, engine="mmap", stats=ParseStats())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import threading
+import unittest
+from config_parser import parse_config
+from config_watcher import ConfigWatcher
+
+class TestConfigWatcher(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "service.conf")
+        with open(self.path, 'w') as f:
+            f.write("workers = 4\n")
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def check_reload(self, use_inotify):
+        reloaded = threading.Event()
+        with ConfigWatcher(self.path, debounce=0.01, poll_interval=0.02,
+                           use_inotify=use_inotify) as watcher:
+            first = watcher.snapshot
+            self.assertEqual(first.config, {"workers": 4})
+            watcher.subscribe(lambda snapshot, diff: reloaded.set())
+            
+            # replace the file the way editors do, by renaming over it
+            replacement = self.path + ".tmp"
+            with open(replacement, 'w') as f:
+                f.write("workers = 8\ndebug = true\n")
+            os.replace(replacement, self.path)
+            
+            self.assertTrue(reloaded.wait(5))
+            self.assertEqual(watcher.snapshot.config, {"workers": 8, "debug": True})
+            self.assertEqual(watcher.snapshot.version, first.version + 1)
+            # earlier snapshots are never mutated
+            self.assertEqual(first.config, {"workers": 4})
+            self.assertEqual(watcher.stats()["reloads"], 1)
+    
+    def test_reload_with_inotify(self):
+        self.check_reload(use_inotify=True)
+    
+    def test_reload_with_polling(self):
+        self.check_reload(use_inotify=False)
+    
+    def test_snapshot_key_order_matches_parse_config(self):
+        with open(self.path, 'w') as f:
+            f.write("\nc = x\nb = 2\nc = x")
+        reloaded = threading.Event()
+        with ConfigWatcher(self.path, debounce=0.01, poll_interval=0.02) as watcher:
+            watcher.subscribe(lambda snapshot, diff: reloaded.set())
+            replacement = self.path + ".tmp"
+            with open(replacement, 'w') as f:
+                f.write("b = 2\nc = x")
+            os.replace(replacement, self.path)
+            
+            self.assertTrue(reloaded.wait(5))
+            self.assertEqual(list(watcher.snapshot.config.items()),
+                             list(parse_config(self.path).items()))
+    
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            ConfigWatcher("non_existent_file.conf").start()
+
+
+if __name__ == '__main__':
+    unittest.main()
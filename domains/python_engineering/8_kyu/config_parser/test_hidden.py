@@ -1,9 +1,31 @@
 import os
+import random
 import tempfile
 import unittest
 import logging
 from io import StringIO
-from config_parser import parse_config
+from config_parser import parse_config, get_value_type, ValueType
+from perf_assertions import Budget, PerformanceAssertions
+import model_solutions
+
+
+def write_config(path, lines, mix, seed=0):
+    # a clean mix of typed values, or one with invalid lines and comments
+    rng = random.Random(seed)
+    if mix == "clean":
+        makers = [lambda i: f"key_{i} = value {rng.randrange(1000)}",
+                  lambda i: f"key_{i} = {rng.randrange(-10**6, 10**6)}",
+                  lambda i: f"key_{i} = {rng.uniform(-1000, 1000):.4f}",
+                  lambda i: f"key_{i} = {rng.choice(['true', 'False'])}"]
+    else:
+        makers = [lambda i: "this line has no separator",
+                  lambda i: f"key_{i} = value {rng.randrange(1000)}",
+                  lambda i: f"key_{i} = {rng.randrange(1000)}",
+                  lambda i: "# generated comment line",
+                  lambda i: f'key_{i} = "unterminated']
+    with open(path, 'w') as f:
+        f.writelines(rng.choice(makers)(i) + "\n" for i in range(lines))
+
 
 class TestConfigParserAdvanced(unittest.TestCase):
     
@@ -111,6 +133,53 @@ class TestConfigParserAdvanced(unittest.TestCase):
         self.assertEqual(config['invalid_int'], "42a")
         self.assertEqual(config['invalid_float'], "3.14.15")
     
+    def test_value_type_edge_cases(self):
+        # Test classification of borderline value tokens
+        cases = {
+            "": ValueType.STRING,
+            '""': ValueType.DOUBLE_QUOTE,
+            '"unterminated': ValueType.STRING,
+            "'it's'": ValueType.STRING,
+            "tRuE": ValueType.BOOL,
+            "truthy": ValueType.STRING,
+            "-0": ValueType.INT,
+            ".": ValueType.STRING,
+            "12.": ValueType.FLOAT,
+            "-.5": ValueType.FLOAT,
+        }
+        for value_token, value_type in cases.items():
+            self.assertEqual(get_value_type(value_token), value_type, value_token)
+
+
+class TestParserPerformance(PerformanceAssertions, unittest.TestCase):
+    
+    REFERENCES = {
+        "simple": model_solutions.parse_config_simple,
+        "regex": model_solutions.parse_config_regex,
+        "functional": model_solutions.parse_config_functional,
+        "class_based": model_solutions.parse_config_class_based,
+        "pythonic": model_solutions.parse_config_pythonic,
+    }
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        # model solutions log every invalid line
+        logging.disable(logging.WARNING)
+    
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        self.temp_dir.cleanup()
+    
+    def test_within_budget_of_model_solutions(self):
+        for mix in ("clean", "dirty"):
+            path = os.path.join(self.temp_dir.name, f"{mix}.conf")
+            write_config(path, 15_000, mix)
+            with self.subTest(mix=mix):
+                result = self.assertWithinBudget(parse_config, self.REFERENCES, path,
+                                                 budget=Budget(time_ratio=3.0, memory_ratio=1.5),
+                                                 repeats=5)
+                self.assertEqual(set(result.references), set(self.REFERENCES))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,24 @@
+import time
+import unittest
+from perf_assertions import Grade, PerformanceAssertions, grade_performance
+
+class TestPerformanceAssertions(PerformanceAssertions, unittest.TestCase):
+    
+    def test_slow_candidate_fails(self):
+        def fast():
+            return sum(range(1000))
+        
+        def slow():
+            time.sleep(0.01)
+            return fast()
+        
+        result = grade_performance(slow, {"fast": fast}, repeats=2)
+        self.assertEqual(result.grade, Grade.FAIL)
+        self.assertGreater(result.time_ratio, 2.0)
+        self.assertIn("fast", result.describe())
+        with self.assertRaises(self.failureException):
+            self.assertWithinBudget(slow, {"fast": fast}, repeats=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+"""
+Scaling benchmark for file_counter.sh on large generated directory trees.
+
+Fixture trees are built from a seeded spec (file count, nesting depth,
+share of hidden and extensionless files, mixed-case extensions) and cached
+under --cache-dir by a hash of that spec, so only the first run pays for
+creating them. Each tree also records the output file_counter.sh should
+print for it, which is checked before any timing counts.
+
+Usage:
+    python bench_file_counter.py                              # 1k..100k files
+    python bench_file_counter.py --files 1000 10000 100000 1000000
+    python bench_file_counter.py --script ../my_solution.sh --output results.json
+
+Exits with status 1 when the script prints the wrong counts, or when its
+run time grows faster than --max-exponent relative to the file count
+(1.0 is linear).
+"""
+
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Any
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "anywars-fixtures")
+# bump when the generator changes, so stale cached trees aren't reused
+GENERATOR_VERSION = 1
+
+# each extension shows up in several casings, which count separately
+EXTENSIONS = {
+    "txt": ["txt", "TXT", "Txt"],
+    "jpg": ["jpg", "JPG"],
+    "sh": ["sh"],
+    "py": ["py"],
+    "log": ["log", "LOG"],
+    "gz": ["tar.gz", "gz"],
+    "json": ["json"],
+    "md": ["md", "MD"],
+}
+NO_EXTENSION = "(no extension)"
+
+
+@dataclass(frozen=True)
+class TreeSpec:
+    files: int
+    seed: int = 0
+    # deepest level of nested subdirectories
+    depth: int = 8
+    # share of files placed directly in the root, the only ones counted
+    top_level_ratio: float = 0.5
+    hidden_ratio: float = 0.1
+    no_extension_ratio: float = 0.1
+
+    def digest(self) -> str:
+        payload = json.dumps({"version": GENERATOR_VERSION, **asdict(self)}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def _touch(path: str) -> None:
+    os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+
+
+def _file_name(rng: random.Random, index: int, spec: TreeSpec) -> tuple[str, str]:
+    """Return a file name and the extension file_counter.sh should report."""
+    if rng.random() < spec.no_extension_ratio:
+        # hidden files always get an extension, ".name" alone is ambiguous
+        return f"file{index}", NO_EXTENSION
+    casing = rng.choice(EXTENSIONS[rng.choice(list(EXTENSIONS))])
+    prefix = "." if rng.random() < spec.hidden_ratio else ""
+    return f"{prefix}file{index}.{casing}", casing.rsplit(".", 1)[-1]
+
+
+def build_tree(spec: TreeSpec, directory: str) -> Counter:
+    """Create the tree described by spec under directory, returning the expected counts."""
+    rng = random.Random(spec.seed)
+    expected: Counter = Counter()
+    # roughly a thousand files per subdirectory, each at a random depth
+    subdirs = []
+    for index in range(max(1, spec.files // 1000)):
+        parts = [f"dir{index}"] + [f"level{level}" for level in range(rng.randint(0, spec.depth - 1))]
+        subdir = os.path.join(directory, *parts)
+        os.makedirs(subdir)
+        subdirs.append(subdir)
+    for index in range(spec.files):
+        name, extension = _file_name(rng, index, spec)
+        if rng.random() < spec.top_level_ratio:
+            _touch(os.path.join(directory, name))
+            expected[extension] += 1
+        else:
+            _touch(os.path.join(rng.choice(subdirs), name))
+    return expected
+
+
+def get_fixture(spec: TreeSpec, cache_dir: str = DEFAULT_CACHE_DIR) -> tuple[str, Counter]:
+    """Return the root of a cached tree for spec and its expected counts, building it if needed."""
+    fixture_dir = os.path.join(cache_dir, spec.digest())
+    manifest_path = os.path.join(fixture_dir, "manifest.json")
+    tree_dir = os.path.join(fixture_dir, "tree")
+    try:
+        with open(manifest_path) as f:
+            return tree_dir, Counter(json.load(f)["expected"])
+    except (FileNotFoundError, ValueError):
+        pass
+    os.makedirs(cache_dir, exist_ok=True)
+    # build beside the cache entry and rename, so an interrupted build is never reused
+    temp_dir = tempfile.mkdtemp(prefix=f"{spec.digest()}.", dir=cache_dir)
+    try:
+        expected = build_tree(spec, os.path.join(temp_dir, "tree"))
+        with open(os.path.join(temp_dir, "manifest.json"), "w") as f:
+            json.dump({"spec": asdict(spec), "expected": expected}, f, indent=2)
+        shutil.rmtree(fixture_dir, ignore_errors=True)
+        os.rename(temp_dir, fixture_dir)
+    except BaseException:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+    return tree_dir, expected
+
+
+def expected_output(expected: Counter) -> list[str]:
+    # order-insensitive, sorting rules for mixed case depend on the locale
+    return sorted(f"{extension}: {count}" for extension, count in expected.items())
+
+
+def time_script(script: str, tree_dir: str, repeats: int) -> tuple[float, list[str]]:
+    seconds = float("inf")
+    lines: list[str] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        completed = subprocess.run(["bash", script, tree_dir], capture_output=True, text=True)
+        seconds = min(seconds, time.perf_counter() - start)
+        lines = sorted(line for line in completed.stdout.splitlines() if line.strip())
+    return seconds, lines
+
+
+def scaling_exponent(results: list[dict[str, Any]]) -> float | None:
+    """Slope of log(time) over log(files) between the smallest and largest run."""
+    if len(results) < 2:
+        return None
+    first, last = results[0], results[-1]
+    if first["seconds"] <= 0 or last["files"] == first["files"]:
+        return None
+    return math.log(last["seconds"] / first["seconds"]) / math.log(last["files"] / first["files"])
+
+
+def run(script: str, sizes: list[int], seed: int, depth: int, repeats: int,
+        cache_dir: str) -> list[dict[str, Any]]:
+    results = []
+    for files in sorted(sizes):
+        spec = TreeSpec(files=files, seed=seed, depth=depth)
+        start = time.perf_counter()
+        tree_dir, expected = get_fixture(spec, cache_dir)
+        setup_seconds = time.perf_counter() - start
+        seconds, lines = time_script(script, tree_dir, repeats)
+        correct = lines == expected_output(expected)
+        results.append({
+            "files": files,
+            "spec": spec.digest(),
+            "seconds": seconds,
+            "files_per_sec": files / seconds if seconds else float("inf"),
+            "correct": correct,
+            "setup_seconds": setup_seconds,
+        })
+        print(f"{files:>10,} files {seconds:>9.3f}s {files / seconds:>14,.0f} files/s "
+              f"{'ok' if correct else 'WRONG OUTPUT'}  (fixture {setup_seconds:.2f}s)")
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--script", default=os.path.join(HERE, "file_counter.sh"))
+    parser.add_argument("--files", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--max-exponent", type=float, default=1.3,
+                        help="largest allowed growth of time with file count (default 1.3)")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    results = run(args.script, args.files, args.seed, args.depth, args.repeats, args.cache_dir)
+    exponent = scaling_exponent(results)
+    if exponent is not None:
+        print(f"scaling exponent {exponent:.2f} (1.0 is linear)")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"script": args.script, "exponent": exponent, "results": results}, f, indent=2)
+    failed = not all(result["correct"] for result in results)
+    if exponent is not None and exponent > args.max_exponent:
+        print(f"FAIL: run time grows faster than files^{args.max_exponent}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+Run every challenge test suite under domains/ in parallel.
+
+Discovers domains/<domain>/<N>_kyu/<challenge>/test_*.py and test_*.sh and
+runs each one in a process pool, inside a fresh copy of its challenge
+directory so suites can't trip over each other's scratch files. A suite
+passes when it exits with status 0 and, for shell suites, prints at least
+one "PASS" line and no "FAIL" line. Shell suites that print neither, like
+ones that only show expected and actual output side by side, are
+reported as NO VERDICT along with their output. Suites that import
+perf_assertions compare timings, so they run one at a time after the rest.
+
+Passing suites are cached in .test_cache.json, keyed on a hash of the test
+file and the challenge's solution files; they are skipped until one of
+those changes.
+
+Usage:
+    python run_tests.py                                  # everything
+    python run_tests.py domains/shell_scripting          # one domain
+    python run_tests.py --jobs 8 --timeout 60 --no-cache
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from typing import Any
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DOMAINS_DIR = os.path.join(ROOT, "domains")
+CACHE_PATH = os.path.join(ROOT, ".test_cache.json")
+
+# copied into the work directory but never part of the solution hash
+_IGNORED = shutil.ignore_patterns("__pycache__", "*.pyc", "*.snap", ".pytest_cache")
+
+
+class Status(str, Enum):
+    PASS = "PASS"
+    FAIL = "FAIL"
+    TIMEOUT = "TIMEOUT"
+    # a shell suite that ran cleanly but printed no PASS or FAIL line
+    NO_VERDICT = "NO VERDICT"
+    CACHED = "CACHED"
+
+
+def discover(paths: list[str]) -> list[str]:
+    """Return the test files under paths, sorted for a stable report."""
+    suites = []
+    for path in paths:
+        if os.path.isfile(path):
+            suites.append(os.path.abspath(path))
+            continue
+        for directory, subdirs, files in os.walk(path):
+            subdirs[:] = sorted(d for d in subdirs if d != "__pycache__")
+            suites.extend(os.path.join(directory, name) for name in files
+                          if name.startswith("test_") and name.endswith((".py", ".sh")))
+    return sorted(set(suites))
+
+
+def suite_hash(test_path: str) -> str:
+    """Hash the test file together with the solution files next to it.
+
+    Other test files and markdown don't affect this suite's result, so
+    editing them doesn't invalidate it.
+    """
+    challenge_dir = os.path.dirname(test_path)
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(challenge_dir)):
+        path = os.path.join(challenge_dir, name)
+        if not os.path.isfile(path) or name.endswith(".md") or name.endswith((".pyc", ".snap")):
+            continue
+        if name.startswith("test_") and path != test_path:
+            continue
+        digest.update(name.encode())
+        digest.update(b"\0")
+        with open(path, "rb") as f:
+            digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def run_suite(test_path: str, timeout: float) -> dict[str, Any]:
+    """Run one suite in a scratch copy of its challenge directory."""
+    challenge_dir = os.path.dirname(test_path)
+    name = os.path.basename(test_path)
+    if name.endswith(".py"):
+        command = [sys.executable, name]
+    else:
+        command = ["bash", name]
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="anywars-") as scratch:
+        work_dir = os.path.join(scratch, os.path.basename(challenge_dir))
+        shutil.copytree(challenge_dir, work_dir, ignore=_IGNORED)
+        try:
+            completed = subprocess.run(command, cwd=work_dir, stdin=subprocess.DEVNULL,
+                                       stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                       timeout=timeout)
+        except subprocess.TimeoutExpired as error:
+            output = (error.output or b"").decode(errors="replace")
+            status = Status.TIMEOUT
+        else:
+            output = completed.stdout.decode(errors="replace")
+            status = Status.FAIL if completed.returncode != 0 else Status.PASS
+            if name.endswith(".sh") and status == Status.PASS:
+                # shell suites report results on stdout and still exit 0
+                verdicts = {line.lstrip()[:4] for line in output.splitlines()} & {"PASS", "FAIL"}
+                if "FAIL" in verdicts:
+                    status = Status.FAIL
+                elif not verdicts:
+                    status = Status.NO_VERDICT
+    return {
+        "suite": os.path.relpath(test_path, ROOT),
+        "status": status,
+        "seconds": time.perf_counter() - start,
+        "output": output,
+    }
+
+
+def is_timing_sensitive(test_path: str) -> bool:
+    """Whether a suite grades performance, so must not share the CPU."""
+    with open(test_path, errors="replace") as f:
+        return "perf_assertions" in f.read()
+
+
+def load_cache(path: str) -> dict[str, dict[str, Any]]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_cache(path: str, cache: dict[str, dict[str, Any]]) -> None:
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def run(suites: list[str], jobs: int, timeout: float, cache: dict[str, dict[str, Any]] | None
+        ) -> list[dict[str, Any]]:
+    results = {}
+    pending = {}
+    for test_path in suites:
+        suite = os.path.relpath(test_path, ROOT)
+        digest = suite_hash(test_path)
+        cached = cache.get(suite) if cache is not None else None
+        if cached is not None and cached["hash"] == digest:
+            results[suite] = {"suite": suite, "status": Status.CACHED,
+                              "seconds": cached["seconds"], "output": ""}
+        else:
+            pending[test_path] = digest
+
+    def record(test_path: str, result: dict[str, Any]) -> None:
+        results[result["suite"]] = result
+        # only a PASS is cached, NO_VERDICT suites run every time
+        if cache is not None and result["status"] == Status.PASS:
+            cache[result["suite"]] = {"hash": pending[test_path], "seconds": result["seconds"]}
+        elif cache is not None:
+            cache.pop(result["suite"], None)
+
+    serial = [test_path for test_path in pending if is_timing_sensitive(test_path)]
+    parallel = [test_path for test_path in pending if test_path not in serial]
+    if parallel:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(parallel))) as pool:
+            futures = {test_path: pool.submit(run_suite, test_path, timeout) for test_path in parallel}
+            for test_path, future in futures.items():
+                record(test_path, future.result())
+    # run alone, after the pool, so other suites can't skew their timings
+    for test_path in serial:
+        record(test_path, run_suite(test_path, timeout))
+    return [results[os.path.relpath(test_path, ROOT)] for test_path in suites]
+
+
+def report(results: list[dict[str, Any]], wall_seconds: float, verbose: bool = False) -> None:
+    for result in results:
+        if (result["status"] in (Status.FAIL, Status.TIMEOUT, Status.NO_VERDICT)
+                or (verbose and result["output"])):
+            print(f"===== {result['suite']} ({result['status'].value}) =====")
+            print(result["output"].rstrip())
+            print()
+    for result in results:
+        print(f"{result['status'].value:<10} {result['seconds']:>8.2f}s  {result['suite']}")
+    counts = {status: sum(result["status"] == status for result in results) for status in Status}
+    ran_seconds = sum(result["seconds"] for result in results if result["status"] != Status.CACHED)
+    print(f"\n{len(results)} suites: " + ", ".join(f"{count} {status.value.lower()}"
+                                                   for status, count in counts.items() if count)
+          + f" in {wall_seconds:.2f}s (suites took {ran_seconds:.2f}s)")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", default=[DOMAINS_DIR],
+                        help="test files or directories to search (default: domains/)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds allowed per suite")
+    parser.add_argument("--no-cache", action="store_true", help="run every suite, even unchanged ones")
+    parser.add_argument("--cache", default=CACHE_PATH, help="cache file (default: .test_cache.json)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="print the output of passing suites too")
+    args = parser.parse_args(argv)
+
+    suites = discover(args.paths)
+    if not suites:
+        print("no test suites found")
+        return 1
+    cache = None if args.no_cache else load_cache(args.cache)
+    start = time.perf_counter()
+    results = run(suites, max(args.jobs, 1), args.timeout, cache)
+    report(results, time.perf_counter() - start, args.verbose)
+    if cache is not None:
+        save_cache(args.cache, cache)
+    # a missing verdict isn't a failure, it is reported for a person to judge
+    return 0 if all(result["status"] in (Status.PASS, Status.CACHED, Status.NO_VERDICT)
+                    for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())